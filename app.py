@@ -6,17 +6,25 @@ Flask-based web application for generating and analyzing traditional Kolam patte
 Provides an interactive web interface for pattern creation, visualization, and export.
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, url_for
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 import json
+import orjson
 import base64
 import io
 import os
-from datetime import datetime
+import secrets
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib
 matplotlib.use('Agg')  # Use non-GUI backend for web
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
+from PIL import Image, ImageChops
 
 # Import our Kolam modules
 from kolam_geometry import Point2D, KolamPattern, KolamType
@@ -24,16 +32,94 @@ from kolam_generator import KolamGenerator
 from kolam_visualizer import KolamVisualizer
 from kolam_examples import TraditionalPatterns
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, which also serializes NumPy values"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get('sort_keys'):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'kolam_patterns_2024'
+app.json = OrjsonProvider(app)
+
+# Gzip JSON and SVG responses for clients that accept it; level 1 keeps CPU cost low
+app.config['COMPRESS_ALGORITHM'] = 'gzip'
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'image/svg+xml']
+app.config['COMPRESS_LEVEL'] = 1
+Compress(app)
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts least recently used entries beyond max_size"""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+    
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
 
 # Initialize our generators
 generator = KolamGenerator()
 visualizer = KolamVisualizer(figsize=(10, 10))
 traditional = TraditionalPatterns()
 
-# Global storage for current pattern (in production, use proper session management)
-current_patterns = {}
+# Traditional patterns never change: TraditionalPatterns caches each built pattern,
+# and its rendered PNG and analysis are cached here by pattern name
+traditional_renders = LRUCache(len(TraditionalPatterns.PATTERN_FACTORIES))
+
+# Recently generated patterns (in production, use proper session management)
+PATTERN_CACHE_SIZE = 256
+current_patterns = LRUCache(PATTERN_CACHE_SIZE)
+
+# Rendered PNG previews and SVG exports keyed by (pattern_id, kind), so repeat
+# requests skip re-rendering
+RENDER_CACHE_SIZE = 64
+rendered_images = LRUCache(RENDER_CACHE_SIZE)
+
+# Worker processes for Matplotlib rendering, so concurrent requests are not serialized on the GIL
+RENDER_TIMEOUT = 30
+MAX_BATCH_SIZE = 16
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+# Pixel width bounds for PNG exports, and the margin kept around cropped content
+EXPORT_MIN_PX = 800
+EXPORT_MAX_PX = 2400
+CROP_PAD_INCHES = 0.1
+EXPORT_SPOOL_SIZE = 1024 * 1024
+
+# Per-thread Figure/Axes reused across renders to skip Figure setup on every request
+_fig_cache = threading.local()
 
 @app.route('/')
 def index():
@@ -58,52 +144,51 @@ def generate_pattern():
         pattern_type = data.get('type', 'pulli')
         params = data.get('parameters', {})
         
-        # Generate pattern based on type
-        if pattern_type == 'pulli':
-            rows = params.get('rows', 5)
-            cols = params.get('cols', 5)
-            style = params.get('style', 'basic')
-            pattern = generator.generate_pulli_kolam(rows, cols, style)
-            
-        elif pattern_type == 'sikku':
-            complexity = params.get('complexity', 3)
-            pattern = generator.generate_sikku_kolam(complexity)
-            
-        elif pattern_type == 'kambi':
-            size = params.get('size', 6)
-            style = params.get('style', 'geometric')
-            pattern = generator.generate_kambi_kolam(size, style)
-            
-        elif pattern_type == 'flower':
-            petals = params.get('petals', 8)
-            layers = params.get('layers', 3)
-            pattern = generator.generate_flower_kolam(petals, layers)
-            
-        elif pattern_type == 'mandala':
-            rings = params.get('rings', 4)
-            segments = params.get('segments', 8)
-            pattern = generator.generate_mandala_kolam(rings, segments)
-            
-        else:
-            pattern = generator.generate_pulli_kolam(5, 5, 'basic')
+        pattern = build_pattern(pattern_type, params)
         
         # Store pattern for later use
-        pattern_id = f"pattern_{datetime.now().timestamp()}"
+        pattern_id = new_pattern_id("pattern")
         current_patterns[pattern_id] = pattern
         
-        # Generate visualization
-        image_data = generate_pattern_image(pattern)
-        
         # Analyze pattern properties
         analysis = analyze_pattern(pattern)
         
+        return jsonify(pattern_response(pattern_id, pattern, analysis))
+        
+    except Exception as e:
         return jsonify({
-            'success': True,
-            'pattern_id': pattern_id,
-            'image': image_data,
-            'analysis': analysis,
-            'name': pattern.name
-        })
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/batch_generate', methods=['POST'])
+def batch_generate():
+    """Generate several patterns, rendering their previews in parallel"""
+    try:
+        specs = request.get_json()
+        if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+            return jsonify({'success': False, 'error': 'Expected a list of pattern spec objects'}), 400
+        if len(specs) > MAX_BATCH_SIZE:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_BATCH_SIZE} patterns per batch'
+            }), 400
+        
+        # Build every pattern first so all renders are in flight together
+        pending = []
+        for spec in specs:
+            pattern = build_pattern(spec.get('type', 'pulli'), spec.get('parameters', {}))
+            pattern_id = new_pattern_id("pattern")
+            current_patterns[pattern_id] = pattern
+            future = get_render_pool().submit(generate_pattern_image, pattern)
+            pending.append((pattern_id, pattern, future))
+        
+        results = []
+        for pattern_id, pattern, future in pending:
+            rendered_images[(pattern_id, 'pattern')] = future.result(timeout=RENDER_TIMEOUT)
+            results.append(pattern_response(pattern_id, pattern, analyze_pattern(pattern)))
+        
+        return jsonify({'success': True, 'patterns': results})
         
     except Exception as e:
         return jsonify({
@@ -115,35 +200,15 @@ def generate_pattern():
 def get_traditional_pattern(pattern_name):
     """Get a specific traditional pattern"""
     try:
-        pattern_map = {
-            'basic_pulli': traditional.create_basic_pulli_kolam,
-            'diamond_pulli': traditional.create_diamond_pulli_kolam,
-            'rangoli_flower': traditional.create_rangoli_flower,
-            'deepavali_special': traditional.create_deepavali_special,
-            'pongal_kolam': traditional.create_pongal_kolam,
-            'geometric_sikku': traditional.create_geometric_sikku
-        }
-        
-        if pattern_name in pattern_map:
-            pattern = pattern_map[pattern_name]()
+        if pattern_name in TraditionalPatterns.PATTERN_FACTORIES:
+            pattern, png_bytes, analysis = get_traditional_entry(pattern_name)
             
-            # Store pattern
-            pattern_id = f"traditional_{pattern_name}_{datetime.now().timestamp()}"
+            # Store pattern along with its pre-rendered image
+            pattern_id = new_pattern_id(f"traditional_{pattern_name}")
             current_patterns[pattern_id] = pattern
+            rendered_images[(pattern_id, 'pattern')] = png_bytes
             
-            # Generate visualization
-            image_data = generate_pattern_image(pattern)
-            
-            # Analyze pattern
-            analysis = analyze_pattern(pattern)
-            
-            return jsonify({
-                'success': True,
-                'pattern_id': pattern_id,
-                'image': image_data,
-                'analysis': analysis,
-                'name': pattern.name
-            })
+            return jsonify(pattern_response(pattern_id, pattern, analysis))
         else:
             return jsonify({
                 'success': False,
@@ -160,17 +225,15 @@ def get_traditional_pattern(pattern_name):
 def export_pattern(pattern_id, format):
     """Export pattern in specified format"""
     try:
-        if pattern_id not in current_patterns:
+        pattern = current_patterns.get(pattern_id)
+        if pattern is None:
             return jsonify({'success': False, 'error': 'Pattern not found'}), 404
         
-        pattern = current_patterns[pattern_id]
-        
         if format == 'png':
-            # Generate high-resolution PNG
-            img_buffer = io.BytesIO()
-            fig = Figure(figsize=(12, 12), dpi=300)
-            ax = fig.add_subplot(111)
-            ax.set_facecolor('#FFF8DC')
+            # Generate PNG sized to the pattern extent; large files spill to disk
+            # and send_file streams them out in chunks
+            img_buffer = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+            fig, ax = get_render_axes(figsize=(12, 12))
             
             # Draw pattern
             if pattern.grid:
@@ -178,8 +241,8 @@ def export_pattern(pattern_id, format):
             visualizer._draw_curves(ax, pattern.curves)
             visualizer._customize_plot(ax, pattern, pattern.name)
             
-            fig.savefig(img_buffer, format='png', bbox_inches='tight', 
-                       facecolor='#FFF8DC', dpi=300)
+            write_figure_png(fig, img_buffer, dpi=export_dpi(fig, ax, pattern),
+                             width_bounds=(EXPORT_MIN_PX, EXPORT_MAX_PX))
             img_buffer.seek(0)
             
             return send_file(img_buffer, mimetype='image/png', 
@@ -187,11 +250,11 @@ def export_pattern(pattern_id, format):
                            download_name=f'{pattern.name.replace(" ", "_")}.png')
             
         elif format == 'svg':
-            # Generate SVG
-            svg_content = generate_svg_content(pattern)
-            svg_buffer = io.BytesIO(svg_content.encode('utf-8'))
+            # Generate SVG once per pattern and serve the cached bytes
+            svg_content = get_rendered_image(pattern_id, 'svg',
+                                             lambda: generate_svg_content(pattern).encode('utf-8'))
             
-            return send_file(svg_buffer, mimetype='image/svg+xml',
+            return send_file(io.BytesIO(svg_content), mimetype='image/svg+xml',
                            as_attachment=True,
                            download_name=f'{pattern.name.replace(" ", "_")}.svg')
         
@@ -201,18 +264,35 @@ def export_pattern(pattern_id, format):
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/image/<pattern_id>.png')
+def pattern_image(pattern_id):
+    """Serve the rendered PNG preview of a pattern"""
+    try:
+        pattern = current_patterns.get(pattern_id)
+        if pattern is None:
+            return jsonify({'success': False, 'error': 'Pattern not found'}), 404
+        
+        png_bytes = get_rendered_image(pattern_id, 'pattern',
+                                       lambda: render_in_pool(generate_pattern_image, pattern))
+        
+        return send_file(io.BytesIO(png_bytes), mimetype='image/png')
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/analyze_symmetries/<pattern_id>')
 def analyze_symmetries(pattern_id):
     """Perform detailed symmetry analysis on pattern"""
     try:
-        if pattern_id not in current_patterns:
+        pattern = current_patterns.get(pattern_id)
+        if pattern is None:
             return jsonify({'success': False, 'error': 'Pattern not found'}), 404
-        
-        pattern = current_patterns[pattern_id]
         pattern.analyze_symmetries()
         
         # Generate symmetry visualization
-        image_data = generate_symmetry_image(pattern)
+        png_bytes = get_rendered_image(pattern_id, 'symmetry',
+                                       lambda: render_in_pool(generate_symmetry_image, pattern))
+        image_data = png_data_uri(png_bytes)
         
         symmetry_info = {
             'symmetries': [s.value for s in pattern.symmetries],
@@ -232,11 +312,173 @@ def analyze_symmetries(pattern_id):
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
-def generate_pattern_image(pattern, show_symmetry=False):
-    """Generate base64 encoded image of the pattern"""
-    fig = Figure(figsize=(8, 8), facecolor='#FFF8DC')
-    ax = fig.add_subplot(111)
+def get_traditional_entry(pattern_name):
+    """Get (pattern, png_bytes, analysis) for a traditional pattern, rendering it only once"""
+    pattern = traditional.get_pattern(pattern_name)
+    rendered = traditional_renders.get(pattern_name)
+    if rendered is None:
+        rendered = (generate_pattern_image(pattern), analyze_pattern(pattern))
+        traditional_renders[pattern_name] = rendered
+    return (pattern, *rendered)
+
+def precompute_traditional_patterns():
+    """Build and render every traditional pattern ahead of the first request"""
+    for pattern_name in TraditionalPatterns.PATTERN_FACTORIES:
+        get_traditional_entry(pattern_name)
+
+def new_pattern_id(prefix):
+    """Create a collision-free pattern id"""
+    return f"{prefix}_{secrets.token_hex(8)}"
+
+def build_pattern(pattern_type, params):
+    """Generate a pattern from an API type name and its parameters"""
+    # Generate pattern based on type
+    if pattern_type == 'pulli':
+        rows = params.get('rows', 5)
+        cols = params.get('cols', 5)
+        style = params.get('style', 'basic')
+        pattern = generator.generate_pulli_kolam(rows, cols, style)
+        
+    elif pattern_type == 'sikku':
+        complexity = params.get('complexity', 3)
+        pattern = generator.generate_sikku_kolam(complexity)
+        
+    elif pattern_type == 'kambi':
+        size = params.get('size', 6)
+        style = params.get('style', 'geometric')
+        pattern = generator.generate_kambi_kolam(size, style)
+        
+    elif pattern_type == 'flower':
+        petals = params.get('petals', 8)
+        layers = params.get('layers', 3)
+        pattern = generator.generate_flower_kolam(petals, layers)
+        
+    elif pattern_type == 'mandala':
+        rings = params.get('rings', 4)
+        segments = params.get('segments', 8)
+        pattern = generator.generate_mandala_kolam(rings, segments)
+        
+    else:
+        pattern = generator.generate_pulli_kolam(5, 5, 'basic')
+    
+    return pattern
+
+def pattern_response(pattern_id, pattern, analysis):
+    """Build the JSON body for a newly stored pattern"""
+    response = {
+        'success': True,
+        'pattern_id': pattern_id,
+        'image_url': url_for('pattern_image', pattern_id=pattern_id),
+        'analysis': analysis,
+        'name': pattern.name
+    }
+    
+    # Inline the image only when explicitly requested with ?embed=1
+    if request.args.get('embed') == '1':
+        png_bytes = get_rendered_image(pattern_id, 'pattern',
+                                       lambda: render_in_pool(generate_pattern_image, pattern))
+        response['image'] = png_data_uri(png_bytes)
+    
+    return response
+
+def png_data_uri(png_bytes):
+    """Encode PNG bytes as a base64 data URI"""
+    return f"data:image/png;base64,{base64.b64encode(png_bytes).decode()}"
+
+def get_rendered_image(pattern_id, kind, render):
+    """Return a cached rendered image, calling render() only on a cache miss"""
+    key = (pattern_id, kind)
+    image_data = rendered_images.get(key)
+    if image_data is None:
+        image_data = render()
+        rendered_images[key] = image_data
+    return image_data
+
+def get_render_pool():
+    """Get the shared render process pool, starting it on first use"""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _render_pool
+
+def render_in_pool(render, pattern):
+    """Run a render function for pattern in a worker process and wait for its result"""
+    return get_render_pool().submit(render, pattern).result(timeout=RENDER_TIMEOUT)
+
+def get_render_axes(figsize=(8, 8)):
+    """Get this thread's cached Figure/Axes for figsize, cleared and ready to draw"""
+    figures = getattr(_fig_cache, 'figures', None)
+    if figures is None:
+        figures = _fig_cache.figures = {}
+    
+    if figsize not in figures:
+        fig = Figure(figsize=figsize, facecolor='#FFF8DC')
+        FigureCanvasAgg(fig)
+        figures[figsize] = (fig, fig.add_subplot(111))
+    
+    fig, ax = figures[figsize]
+    ax.cla()
     ax.set_facecolor('#FFF8DC')
+    return fig, ax
+
+def write_figure_png(fig, fileobj, dpi, width_bounds=None):
+    """Rasterize fig in a single Agg pass and write it as PNG, cropped to the drawn content
+    
+    Equivalent to savefig(bbox_inches='tight') without the extra layout/draw pass;
+    Pillow encodes the RGBA buffer directly at a fast compression level. With
+    width_bounds (min_px, max_px), a crop that lands just outside them is resampled
+    to the nearest bound.
+    """
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
+    
+    background = Image.new('RGB', image.size, '#FFF8DC')
+    content_box = ImageChops.difference(image, background).getbbox()
+    if content_box:
+        pad = int(CROP_PAD_INCHES * dpi)
+        left, top, right, bottom = content_box
+        image = image.crop((max(left - pad, 0), max(top - pad, 0),
+                            min(right + pad, image.width), min(bottom + pad, image.height)))
+    
+    if width_bounds:
+        width = max(width_bounds[0], min(width_bounds[1], image.width))
+        if width != image.width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+    
+    image.save(fileobj, format='PNG', compress_level=1)
+
+def export_dpi(fig, ax, pattern):
+    """Pick an export DPI giving 800-2400 px across, scaled by the pattern's extent
+    
+    write_figure_png crops to the drawn content, so the DPI is sized to the width
+    that survives the crop: the curves and the dots inside the axes limits, or the
+    title if that is wider, plus the crop padding.
+    """
+    bbox_min, bbox_max = pattern.get_bounding_box()
+    diagonal = bbox_min.distance_to(bbox_max)
+    target_px = max(EXPORT_MIN_PX, min(EXPORT_MAX_PX, int(diagonal * 100)))
+    
+    # Drawn x extent in data units; dots beyond the axes limits are clipped away
+    x0, x1 = ax.get_xlim()
+    xs = [bbox_min.x, bbox_max.x] if len(pattern.get_all_points()) else []
+    if pattern.grid:
+        dot_xs = pattern.grid.get_all_coords()[:, 0]
+        dot_xs = dot_xs[(dot_xs >= x0) & (dot_xs <= x1)]
+        if len(dot_xs):
+            xs += [dot_xs.min(), dot_xs.max()]
+    drawn = max(xs) - min(xs) if xs else 0.0
+    
+    ax.apply_aspect()
+    axes_width = ax.get_position().width * fig.get_figwidth()
+    title_width = ax.title.get_window_extent(fig.canvas.get_renderer()).width / fig.dpi
+    content_width = max(axes_width * drawn / (x1 - x0), title_width) + 2 * CROP_PAD_INCHES
+    return target_px / content_width
+
+def generate_pattern_image(pattern, show_symmetry=False):
+    """Render the pattern to PNG bytes"""
+    fig, ax = get_render_axes()
     
     # Draw pattern components
     if pattern.grid:
@@ -248,22 +490,14 @@ def generate_pattern_image(pattern, show_symmetry=False):
     
     visualizer._customize_plot(ax, pattern, pattern.name)
     
-    # Convert to base64
     img_buffer = io.BytesIO()
-    fig.savefig(img_buffer, format='png', bbox_inches='tight', 
-               facecolor='#FFF8DC', dpi=150)
-    img_buffer.seek(0)
+    write_figure_png(fig, img_buffer, dpi=150)
     
-    img_data = base64.b64encode(img_buffer.getvalue()).decode()
-    plt.close(fig)
-    
-    return f"data:image/png;base64,{img_data}"
+    return img_buffer.getvalue()
 
 def generate_symmetry_image(pattern):
-    """Generate image showing symmetry indicators"""
-    fig = Figure(figsize=(8, 8), facecolor='#FFF8DC')
-    ax = fig.add_subplot(111)
-    ax.set_facecolor('#FFF8DC')
+    """Render the pattern with symmetry indicators to PNG bytes"""
+    fig, ax = get_render_axes()
     
     # Draw pattern with symmetry indicators
     if pattern.grid:
@@ -272,16 +506,18 @@ def generate_symmetry_image(pattern):
     visualizer._draw_symmetry_indicators(ax, pattern)
     visualizer._customize_plot(ax, pattern, f"{pattern.name} - Symmetry Analysis")
     
-    # Convert to base64
     img_buffer = io.BytesIO()
-    fig.savefig(img_buffer, format='png', bbox_inches='tight', 
-               facecolor='#FFF8DC', dpi=150)
-    img_buffer.seek(0)
-    
-    img_data = base64.b64encode(img_buffer.getvalue()).decode()
-    plt.close(fig)
+    write_figure_png(fig, img_buffer, dpi=150)
     
-    return f"data:image/png;base64,{img_data}"
+    return img_buffer.getvalue()
+
+# SVG element templates, formatted with % inside the per-dot/per-point loops
+SVG_CIRCLE_FMT = '  <circle cx="%s" cy="%s" r="0.05" fill="#8B4513" opacity="0.7"/>\n'
+SVG_POINT_FMT = '%s,%s'
+SVG_PATH_FMT = '''  <path d="%s" 
+                stroke="#FF4500" stroke-width="0.1" 
+                fill="none" stroke-linecap="round" stroke-linejoin="round"/>
+'''
 
 def generate_svg_content(pattern):
     """Generate SVG content for the pattern"""
@@ -289,7 +525,7 @@ def generate_svg_content(pattern):
     width = bbox_max.x - bbox_min.x + 2
     height = bbox_max.y - bbox_min.y + 2
     
-    svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+    header = f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" 
      width="{width*50}" height="{height*50}" 
      viewBox="{bbox_min.x-1} {bbox_min.y-1} {width} {height}">
@@ -300,29 +536,25 @@ def generate_svg_content(pattern):
   
   <!-- Grid dots -->
 '''
+    svg_parts = [header]
     
     # Add dots
     if pattern.grid:
-        for dot in pattern.grid.get_all_dots():
-            svg_content += f'  <circle cx="{dot.x}" cy="{dot.y}" r="0.05" fill="#8B4513" opacity="0.7"/>\n'
+        svg_parts.extend(SVG_CIRCLE_FMT % (x, y)
+                         for x, y in pattern.grid.get_all_coords().tolist())
     
-    svg_content += '\n  <!-- Curves -->\n'
+    svg_parts.append('\n  <!-- Curves -->\n')
     
     # Add curves
-    for i, curve in enumerate(pattern.curves):
-        if curve:
-            path_data = f'M {curve[0].x},{curve[0].y}'
-            for point in curve[1:]:
-                path_data += f' L {point.x},{point.y}'
-            
-            svg_content += f'''  <path d="{path_data}" 
-                stroke="#FF4500" stroke-width="0.1" 
-                fill="none" stroke-linecap="round" stroke-linejoin="round"/>
-'''
+    for curve in pattern.curves:
+        if len(curve):
+            path_data = 'M ' + ' L '.join(SVG_POINT_FMT % (x, y)
+                                          for x, y in curve.tolist())
+            svg_parts.append(SVG_PATH_FMT % path_data)
     
-    svg_content += '\n</svg>'
+    svg_parts.append('\n</svg>')
     
-    return svg_content
+    return ''.join(svg_parts)
 
 def analyze_pattern(pattern):
     """Analyze pattern properties"""
@@ -332,7 +564,7 @@ def analyze_pattern(pattern):
         'name': pattern.name,
         'type': pattern.kolam_type.value,
         'curves_count': len(pattern.curves),
-        'total_points': sum(len(curve) for curve in pattern.curves),
+        'total_points': len(pattern.get_all_points()),
         'dimensions': {
             'width': round(bbox_max.x - bbox_min.x, 2),
             'height': round(bbox_max.y - bbox_min.y, 2)
@@ -369,5 +601,7 @@ if __name__ == '__main__':
     os.makedirs('static/images', exist_ok=True)
     os.makedirs('templates', exist_ok=True)
     
+    precompute_traditional_patterns()
+    
     # Run the Flask app
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -6,24 +6,133 @@ This module provides specific examples of traditional Kolam patterns and
 an interactive interface for generating and customizing patterns.
 """
 
+import functools
 import math
+import numpy as np
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 
-from kolam_geometry import Point2D, KolamPattern, KolamType
+from kolam_geometry import Point2D, KolamPattern, KolamType, CurveGenerator, DotGrid
 from kolam_generator import KolamGenerator
 from kolam_visualizer import KolamVisualizer
 
 
+@functools.lru_cache(maxsize=64)
+def _unit_circle(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Cached (cos, sin) of n evenly spaced angles, read-only since they are shared"""
+    angles = np.arange(n) * 2 * np.pi / n
+    cos, sin = np.cos(angles), np.sin(angles)
+    cos.flags.writeable = False
+    sin.flags.writeable = False
+    return cos, sin
+
+@functools.lru_cache(maxsize=64)
+def _ellipse_template(radius_x: float, radius_y: float, n: int) -> np.ndarray:
+    """Cached (n, 2) offsets of an origin-centered ellipse, read-only since they are shared"""
+    cos, sin = _unit_circle(n)
+    template = np.column_stack([radius_x * cos, radius_y * sin])
+    template.flags.writeable = False
+    return template
+
+def _sample_ellipse(cx, cy, radius_x, radius_y, n: int) -> np.ndarray:
+    """Sample n points around ellipses centered at (cx, cy), shape (..., n, 2) for array centers"""
+    centers = np.stack(np.broadcast_arrays(np.asarray(cx, dtype=float),
+                                           np.asarray(cy, dtype=float)), axis=-1)
+    return centers[..., None, :] + _ellipse_template(radius_x, radius_y, n)
+
+def _sample_polar(cx: float, cy: float, radii, angles) -> np.ndarray:
+    """Points at polar (radii, angles) around (cx, cy), shape broadcast(radii, angles) + (2,)"""
+    radii, angles = np.broadcast_arrays(np.asarray(radii, dtype=float), angles)
+    out = np.empty(radii.shape + (2,))
+    out[..., 0] = cx + radii * np.cos(angles)
+    out[..., 1] = cy + radii * np.sin(angles)
+    return out
+
+def _sample_star(cx: float, cy: float, outer_radius: float, inner_radius: float,
+                 n: int) -> np.ndarray:
+    """Sample n points around a star alternating between outer and inner radii"""
+    cos, sin = _unit_circle(n)
+    radii = np.where(np.arange(n) % 2 == 0, outer_radius, inner_radius)
+    
+    out = np.empty((n, 2))
+    out[:, 0] = cx + radii * cos
+    out[:, 1] = cy + radii * sin
+    return out
+
+def _sample_quadratic_bezier(p0, p1, p2, eps: float) -> np.ndarray:
+    """Sample a quadratic Bezier curve adaptively, subdividing only where it is not flat within eps"""
+    p0, p1, p2 = (np.asarray(p, dtype=float) for p in (p0, p1, p2))
+    
+    # Each halving quarters the second difference p0 - 2*p1 + p2, and half its length bounds
+    # every piece's flatness deviation, so it also bounds the depth and the output size
+    bound = math.hypot(*(p0 - 2 * p1 + p2)) / 2
+    max_depth = 0
+    while bound > eps:
+        bound /= 4
+        max_depth += 1
+    
+    out = np.empty((2 ** max_depth + 1, 2))
+    out[0] = p0
+    count = _subdivide_quadratic_bezier(p0, p1, p2, eps, out, 1)
+    return out[:count]
+
+def _subdivide_quadratic_bezier(p0, p1, p2, eps: float, out: np.ndarray, count: int) -> int:
+    """Write the points after p0 of a de Casteljau subdivision into out[count:], returning the new count"""
+    # Flatness: distance from the control point to the chord p0-p2
+    chord = p2 - p0
+    offset = p1 - p0
+    chord_length = math.hypot(chord[0], chord[1])
+    if chord_length > 0:
+        deviation = abs(chord[0] * offset[1] - chord[1] * offset[0]) / chord_length
+    else:
+        deviation = math.hypot(offset[0], offset[1])
+    
+    if deviation <= eps:
+        out[count] = p2
+        return count + 1
+    
+    # Split at t=0.5 by de Casteljau
+    m01 = (p0 + p1) / 2
+    m12 = (p1 + p2) / 2
+    mid = (m01 + m12) / 2
+    count = _subdivide_quadratic_bezier(p0, m01, mid, eps, out, count)
+    return _subdivide_quadratic_bezier(mid, m12, p2, eps, out, count)
+
 class TraditionalPatterns:
     """Collection of specific traditional Kolam patterns"""
     
+    # Pattern names and the factory method that builds each
+    PATTERN_FACTORIES = {
+        "basic_pulli": "create_basic_pulli_kolam",
+        "diamond_pulli": "create_diamond_pulli_kolam",
+        "rangoli_flower": "create_rangoli_flower",
+        "deepavali_special": "create_deepavali_special",
+        "pongal_kolam": "create_pongal_kolam",
+        "geometric_sikku": "create_geometric_sikku"
+    }
+    
     def __init__(self):
         self.generator = KolamGenerator()
+        self._cache: Dict[str, KolamPattern] = {}
+        self._curve_generators: Dict[Tuple[int, int, float], CurveGenerator] = {}
+    
+    def _get_curve_generator(self, grid: DotGrid) -> CurveGenerator:
+        """Get a CurveGenerator shared by all factories using an identical grid layout"""
+        key = (grid.rows, grid.cols, grid.spacing)
+        if key not in self._curve_generators:
+            self._curve_generators[key] = CurveGenerator(grid)
+        return self._curve_generators[key]
+    
+    def get_pattern(self, name: str) -> KolamPattern:
+        """Get a traditional pattern by name, built once and then served from cache"""
+        if name not in self._cache:
+            self._cache[name] = getattr(self, self.PATTERN_FACTORIES[name])()
+        return self._cache[name]
     
     def create_basic_pulli_kolam(self) -> KolamPattern:
         """Create a basic 5x5 pulli kolam with square loops"""
@@ -38,33 +147,25 @@ class TraditionalPatterns:
         pattern = KolamPattern("Traditional Rangoli Flower", KolamType.MARGAZHI_KOLAM)
         pattern.set_grid(9, 9, spacing=1.0)
         
-        from kolam_geometry import CurveGenerator
-        curve_gen = CurveGenerator(pattern.grid)
+        curve_gen = self._get_curve_generator(pattern.grid)
         center = Point2D(4, 4)  # Center of 9x9 grid
         
-        # Create multiple concentric flower patterns
-        for layer in range(1, 4):
-            radius = layer * 1.2
-            petals = 8 if layer == 1 else 12
-            petal_curve = curve_gen.generate_petal_pattern(center, radius, petals)
-            pattern.add_curve(petal_curve)
+        # Create multiple concentric flower patterns: an 8-petal inner layer, then
+        # two 12-petal layers evaluated as one rose-curve batch
+        pattern.add_curve_array(curve_gen.generate_petal_pattern(center, 1.2, 8))
+        for petal_curve in curve_gen.generate_petal_layers(center, np.arange(2, 4) * 1.2, 12):
+            pattern.add_curve_array(petal_curve)
         
         # Add decorative dots around the flower
-        for angle in range(0, 360, 45):
-            rad = math.radians(angle)
-            dot_x = center.x + 3.5 * math.cos(rad)
-            dot_y = center.y + 3.5 * math.sin(rad)
-            
-            # Small circular decoration
-            decoration = []
-            for i in range(16):
-                dec_angle = i * 2 * math.pi / 16
-                x = dot_x + 0.3 * math.cos(dec_angle)
-                y = dot_y + 0.3 * math.sin(dec_angle)
-                decoration.append(Point2D(x, y))
-            pattern.add_curve(decoration)
-        
-        pattern.analyze_symmetries()
+        cos, sin = _unit_circle(8)
+        dot_xs = center.x + 3.5 * cos
+        dot_ys = center.y + 3.5 * sin
+        
+        # Small circular decoration around each dot: one shared 16-point template
+        # offset to all 8 centers, shape (8 dots, 16 points)
+        for decoration in _sample_ellipse(dot_xs, dot_ys, 0.3, 0.3, 16):
+            pattern.add_curve_array(decoration)
+        
         return pattern
     
     def create_deepavali_special(self) -> KolamPattern:
@@ -72,32 +173,20 @@ class TraditionalPatterns:
         pattern = KolamPattern("Deepavali Special Kolam", KolamType.MARGAZHI_KOLAM)
         pattern.set_grid(11, 11, spacing=1.0)
         
-        from kolam_geometry import CurveGenerator, SymmetryAnalyzer, SymmetryType
-        curve_gen = CurveGenerator(pattern.grid)
+        curve_gen = self._get_curve_generator(pattern.grid)
         center = Point2D(5, 5)  # Center of 11x11 grid
         
-        # Central star pattern
-        star_points = []
-        for i in range(16):
-            angle = i * 2 * math.pi / 16
-            radius = 1.5 if i % 2 == 0 else 0.8  # Alternating radii for star effect
-            x = center.x + radius * math.cos(angle)
-            y = center.y + radius * math.sin(angle)
-            star_points.append(Point2D(x, y))
-        pattern.add_curve(star_points)
+        # Central star pattern, alternating radii for star effect
+        star_points = _sample_star(center.x, center.y, 1.5, 0.8, 16)
+        pattern.add_curve_array(star_points)
         
         # Surrounding mandala rings
         for ring in range(1, 4):
             ring_radius = 2 + ring * 0.8
-            ring_points = []
             segments = 24 + ring * 8
             
-            for i in range(segments):
-                angle = i * 2 * math.pi / segments
-                x = center.x + ring_radius * math.cos(angle)
-                y = center.y + ring_radius * math.sin(angle)
-                ring_points.append(Point2D(x, y))
-            pattern.add_curve(ring_points)
+            ring_points = _sample_ellipse(center.x, center.y, ring_radius, ring_radius, segments)
+            pattern.add_curve_array(ring_points)
         
         # Corner decorations
         corners = [(2, 2), (2, 8), (8, 2), (8, 8)]
@@ -106,9 +195,8 @@ class TraditionalPatterns:
             corner_decoration = curve_gen.generate_spiral_pattern(
                 corner_center, radius=0.8, turns=1.5
             )
-            pattern.add_curve(corner_decoration)
+            pattern.add_curve_array(corner_decoration)
         
-        pattern.analyze_symmetries()
         return pattern
     
     def create_pongal_kolam(self) -> KolamPattern:
@@ -116,48 +204,35 @@ class TraditionalPatterns:
         pattern = KolamPattern("Pongal Festival Kolam", KolamType.MARGAZHI_KOLAM)
         pattern.set_grid(13, 13, spacing=0.8)
         
-        from kolam_geometry import CurveGenerator
-        curve_gen = CurveGenerator(pattern.grid)
+        curve_gen = self._get_curve_generator(pattern.grid)
         center = Point2D(6 * 0.8, 6 * 0.8)  # Center adjustment for spacing
         
-        # Traditional rice plant motif (stylized)
-        for branch in range(8):
-            angle = branch * 2 * math.pi / 8
-            
-            # Main stem
-            stem_points = []
-            for t in range(20):
-                radius = 0.5 + t * 0.15
-                stem_angle = angle + t * 0.1  # Slight curve
-                x = center.x + radius * math.cos(stem_angle)
-                y = center.y + radius * math.sin(stem_angle)
-                stem_points.append(Point2D(x, y))
-            
-            pattern.add_curve(stem_points)
-            
-            # Rice grain decorations along the stem
-            for grain in range(5):
-                grain_radius = 1.5 + grain * 0.6
-                grain_angle = angle + grain * 0.08
-                grain_center = Point2D(
-                    center.x + grain_radius * math.cos(grain_angle),
-                    center.y + grain_radius * math.sin(grain_angle)
-                )
-                
-                # Small oval for rice grain
-                grain_curve = []
-                for i in range(12):
-                    oval_angle = i * 2 * math.pi / 12
-                    x = grain_center.x + 0.2 * math.cos(oval_angle)
-                    y = grain_center.y + 0.15 * math.sin(oval_angle)
-                    grain_curve.append(Point2D(x, y))
-                pattern.add_curve(grain_curve)
+        # Traditional rice plant motif (stylized), all 8 branches in one broadcast
+        angles = np.arange(8)[:, None] * 2 * np.pi / 8
+        
+        # Main stems, shape (8 branches, 20 points, 2)
+        t = np.arange(20)
+        stems = _sample_polar(center.x, center.y, 0.5 + t * 0.15,
+                              angles + t * 0.1)  # Slight curve
+        
+        # Rice grain centers along each stem, shape (8 branches, 5 grains, 2)
+        grain = np.arange(5)
+        grain_centers = _sample_polar(center.x, center.y, 1.5 + grain * 0.6,
+                                      angles + grain * 0.08)
+        
+        # Small oval for each rice grain: one shared 12-point template offset to
+        # all 40 grain centers, shape (8 branches, 5 grains, 12 points, 2)
+        grains = _sample_ellipse(grain_centers[..., 0], grain_centers[..., 1], 0.2, 0.15, 12)
+        
+        for stem, grain_curves in zip(stems, grains):
+            pattern.add_curve_array(stem)
+            for grain_curve in grain_curves:
+                pattern.add_curve_array(grain_curve)
         
         # Central prosperity symbol
         prosperity_symbol = curve_gen.generate_spiral_pattern(center, 0.8, 2)
-        pattern.add_curve(prosperity_symbol)
+        pattern.add_curve_array(prosperity_symbol)
         
-        pattern.analyze_symmetries()
         return pattern
     
     def create_geometric_sikku(self) -> KolamPattern:
@@ -173,14 +248,13 @@ class TraditionalPatterns:
             Point2D(4*1.5, 4*1.5),  # Bottom-right
         ]
         
-        from kolam_geometry import CurveGenerator
-        curve_gen = CurveGenerator(pattern.grid)
+        curve_gen = self._get_curve_generator(pattern.grid)
         
         for i, center in enumerate(centers):
             # Spiral in alternating directions
             turns = 1.5 + i * 0.5
             spiral = curve_gen.generate_spiral_pattern(center, 1.0, turns)
-            pattern.add_curve(spiral)
+            pattern.add_curve_array(spiral)
         
         # Connecting paths between spirals
         connections = [
@@ -190,21 +264,13 @@ class TraditionalPatterns:
             (centers[1], centers[3]),  # Right vertical
         ]
         
+        # Quadratic Bezier curves for smooth connections
         for start, end in connections:
-            connection_points = []
-            for t in range(20):
-                t_norm = t / 19
-                # Bezier curve for smooth connection
-                mid_x = (start.x + end.x) / 2
-                mid_y = (start.y + end.y) / 2 + 0.5  # Slight arch
-                
-                x = (1-t_norm)**2 * start.x + 2*(1-t_norm)*t_norm * mid_x + t_norm**2 * end.x
-                y = (1-t_norm)**2 * start.y + 2*(1-t_norm)*t_norm * mid_y + t_norm**2 * end.y
-                connection_points.append(Point2D(x, y))
-            
-            pattern.add_curve(connection_points)
+            mid = ((start.x + end.x) / 2, (start.y + end.y) / 2 + 0.5)  # Slight arch
+            connection_points = _sample_quadratic_bezier(
+                (start.x, start.y), mid, (end.x, end.y), eps=0.01)
+            pattern.add_curve_array(connection_points)
         
-        pattern.analyze_symmetries()
         return pattern
 
 
@@ -221,6 +287,17 @@ class KolamInteractiveGUI:
         self.traditional = TraditionalPatterns()
         self.current_pattern = None
         
+        # Blitting state: the axes with dots/title/limits is cached as a pixel
+        # background and only the curve layer is redrawn while it still applies
+        self.display_ax = None
+        self.curve_artist = None
+        self.background = None
+        self.background_key = None
+        
+        # Dot artists are kept across patterns and only rebuilt when the grid layout changes
+        self.dot_artists = []
+        self.dot_grid_key = None
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -287,6 +364,8 @@ class KolamInteractiveGUI:
                   command=self.analyze_pattern).pack(fill=tk.X, pady=(0, 5))
         ttk.Button(button_frame, text="Save as PNG", 
                   command=self.save_png).pack(fill=tk.X, pady=(0, 5))
+        ttk.Button(button_frame, text="Quick Save PNG", 
+                  command=self.quick_save_png).pack(fill=tk.X, pady=(0, 5))
         ttk.Button(button_frame, text="Export as SVG", 
                   command=self.export_svg).pack(fill=tk.X, pady=(0, 5))
         ttk.Button(button_frame, text="Analysis Report", 
@@ -296,6 +375,7 @@ class KolamInteractiveGUI:
         self.figure = Figure(figsize=(8, 8), dpi=100)
         self.canvas = FigureCanvasTkAgg(self.figure, canvas_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
         
         # Status bar
         self.status_var = tk.StringVar(value="Ready to generate patterns")
@@ -394,7 +474,7 @@ class KolamInteractiveGUI:
         """Generate pattern based on current settings"""
         try:
             self.status_var.set("Generating pattern...")
-            self.root.update()
+            self.root.update_idletasks()  # Repaint the status bar without pumping user events
             
             pattern_type = self.pattern_type.get()
             
@@ -414,16 +494,8 @@ class KolamInteractiveGUI:
         """Generate a traditional pattern"""
         trad_type = self.traditional_pattern.get()
         
-        pattern_map = {
-            "basic_pulli": self.traditional.create_basic_pulli_kolam,
-            "diamond_pulli": self.traditional.create_diamond_pulli_kolam,
-            "rangoli_flower": self.traditional.create_rangoli_flower,
-            "deepavali_special": self.traditional.create_deepavali_special,
-            "pongal_kolam": self.traditional.create_pongal_kolam,
-            "geometric_sikku": self.traditional.create_geometric_sikku
-        }
-        
-        return pattern_map[trad_type]()
+        # The factories take no parameters, so repeat selections reuse the cached pattern
+        return self.traditional.get_pattern(trad_type)
     
     def generate_parametric_pattern(self) -> KolamPattern:
         """Generate a parametric pattern"""
@@ -455,19 +527,72 @@ class KolamInteractiveGUI:
         if not self.current_pattern:
             return
         
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        ax.set_facecolor('#FFF8DC')
+        pattern = self.current_pattern
+        key = self.get_background_key(pattern)
         
-        # Draw pattern using visualizer methods
-        if self.current_pattern.grid:
-            self.visualizer._draw_dots(ax, self.current_pattern.grid)
+        if self.display_ax is None:
+            self.setup_display_axes()
+        self.curve_artist.set_segments(pattern.curves)
         
-        self.visualizer._draw_curves(ax, self.current_pattern.curves)
-        self.visualizer._customize_plot(ax, self.current_pattern, self.current_pattern.name)
+        # Same grid, title and limits: blit just the new curves over the cached background
+        if self.background is not None and key == self.background_key:
+            self.blit_curves()
+            return
         
+        # Dots only change with the grid layout; otherwise the existing artists stay
+        grid_key = self.get_grid_key(pattern.grid)
+        if grid_key != self.dot_grid_key:
+            for artist in self.dot_artists:
+                artist.remove()
+            existing = len(self.display_ax.collections)
+            if pattern.grid:
+                self.visualizer._draw_dots(self.display_ax, pattern.grid)
+            self.dot_artists = list(self.display_ax.collections[existing:])
+            self.dot_grid_key = grid_key
+        
+        self.visualizer._customize_plot(self.display_ax, pattern, pattern.name)
+        
+        self.background = None
+        self.background_key = key
         self.canvas.draw()
     
+    def setup_display_axes(self):
+        """Create the display axes and its (empty) curve collection once"""
+        ax = self.figure.add_subplot(111)
+        ax.set_facecolor('#FFF8DC')
+        
+        # All curves as one collection: a single artist to draw instead of one per curve.
+        # Limits come from the bounding box in _customize_plot, so skip autoscaling.
+        # Animated, so full draws leave it out of the cached background.
+        self.curve_artist = LineCollection([], colors=self.visualizer.colors['curves'],
+                                           linewidths=2.0, zorder=10, animated=True)
+        ax.add_collection(self.curve_artist, autolim=False)
+        self.display_ax = ax
+    
+    @staticmethod
+    def get_grid_key(grid: Optional[DotGrid]) -> Optional[tuple]:
+        """Identify a dot grid layout by its rows, columns and spacing"""
+        return (grid.rows, grid.cols, grid.spacing) if grid else None
+    
+    def get_background_key(self, pattern: KolamPattern) -> tuple:
+        """Everything the cached background depends on: title, dot grid and axis limits"""
+        bbox_min, bbox_max = pattern.get_bounding_box()
+        return (pattern.name, self.get_grid_key(pattern.grid),
+                bbox_min.x, bbox_min.y, bbox_max.x, bbox_max.y)
+    
+    def on_canvas_draw(self, event):
+        """Recapture the background after every full draw (new pattern, resize) and redraw curves on it"""
+        if self.display_ax is None:
+            return
+        self.background = self.canvas.copy_from_bbox(self.display_ax.bbox)
+        self.display_ax.draw_artist(self.curve_artist)
+    
+    def blit_curves(self):
+        """Restore the cached background and draw only the curve layer over it"""
+        self.canvas.restore_region(self.background)
+        self.display_ax.draw_artist(self.curve_artist)
+        self.canvas.blit(self.display_ax.bbox)
+    
     def analyze_pattern(self):
         """Analyze and display pattern symmetries"""
         if not self.current_pattern:
@@ -478,28 +603,31 @@ class KolamInteractiveGUI:
         self.current_pattern.analyze_symmetries()
         
         # Display analysis
-        analysis_text = f"""Pattern Analysis: {self.current_pattern.name}
-
-Type: {self.current_pattern.kolam_type.value}
-Curves: {len(self.current_pattern.curves)}
-Total Points: {sum(len(curve) for curve in self.current_pattern.curves)}
-
-Detected Symmetries:
-"""
+        pattern = self.current_pattern
+        parts = [
+            f"Pattern Analysis: {pattern.name}",
+            "",
+            f"Type: {pattern.kolam_type.value}",
+            f"Curves: {len(pattern.curves)}",
+            f"Total Points: {len(pattern.get_all_points())}",
+            "",
+            "Detected Symmetries:"
+        ]
         
-        if self.current_pattern.symmetries:
-            for sym in self.current_pattern.symmetries:
-                analysis_text += f"• {sym.value}\n"
+        if pattern.symmetries:
+            parts.extend(f"• {sym.value}" for sym in pattern.symmetries)
         else:
-            analysis_text += "• No clear symmetries detected\n"
+            parts.append("• No clear symmetries detected")
         
-        bbox_min, bbox_max = self.current_pattern.get_bounding_box()
-        analysis_text += f"\nDimensions: {bbox_max.x - bbox_min.x:.1f} × {bbox_max.y - bbox_min.y:.1f}"
+        bbox_min, bbox_max = pattern.get_bounding_box()
+        parts.append("")
+        parts.append(f"Dimensions: {bbox_max.x - bbox_min.x:.1f} × {bbox_max.y - bbox_min.y:.1f}")
+        analysis_text = "\n".join(parts)
         
         messagebox.showinfo("Pattern Analysis", analysis_text)
     
-    def save_png(self):
-        """Save current pattern as PNG"""
+    def save_png(self, fast: bool = False):
+        """Save current pattern as PNG, rasterizing directly with Pillow when fast"""
         if not self.current_pattern:
             messagebox.showwarning("Warning", "Please generate a pattern first")
             return
@@ -510,9 +638,16 @@ Detected Symmetries:
         )
         
         if filename:
-            self.visualizer.save_pattern(self.current_pattern, filename, format='png')
+            if fast:
+                self.visualizer.save_pattern_fast(self.current_pattern, filename)
+            else:
+                self.visualizer.save_pattern(self.current_pattern, filename, format='png')
             messagebox.showinfo("Success", f"Pattern saved as {filename}")
     
+    def quick_save_png(self):
+        """Save current pattern as an untitled PNG without the matplotlib pipeline"""
+        self.save_png(fast=True)
+    
     def export_svg(self):
         """Export current pattern as SVG"""
         if not self.current_pattern:
@@ -559,11 +694,11 @@ def main():
     
     # Generate and display traditional patterns
     patterns = [
-        ("Basic Pulli Kolam", traditional.create_basic_pulli_kolam()),
-        ("Rangoli Flower", traditional.create_rangoli_flower()),
-        ("Deepavali Special", traditional.create_deepavali_special()),
-        ("Pongal Festival Kolam", traditional.create_pongal_kolam()),
-        ("Geometric Sikku", traditional.create_geometric_sikku())
+        ("Basic Pulli Kolam", traditional.get_pattern("basic_pulli")),
+        ("Rangoli Flower", traditional.get_pattern("rangoli_flower")),
+        ("Deepavali Special", traditional.get_pattern("deepavali_special")),
+        ("Pongal Festival Kolam", traditional.get_pattern("pongal_kolam")),
+        ("Geometric Sikku", traditional.get_pattern("geometric_sikku"))
     ]
     
     print("\nGenerated Traditional Patterns:")
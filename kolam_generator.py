@@ -8,10 +8,13 @@ based on the mathematical principles identified in kolam_geometry.py
 
 import math
 import random
+from collections import Counter
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import List, Tuple, Dict, Optional, Set
 from kolam_geometry import (
     DotGrid, Point2D, CurveGenerator, SymmetryAnalyzer, KolamPattern,
-    KolamType, SymmetryType
+    KolamType, SymmetryType, points_to_array
 )
 
 
@@ -21,18 +24,19 @@ class PatternRecognizer:
     def __init__(self):
         self.tolerance = 0.1
     
-    def analyze_grid_structure(self, points: List[Point2D]) -> Dict:
-        """Analyze the underlying grid structure of a Kolam pattern"""
+    def analyze_grid_structure(self, points) -> Dict:
+        """Analyze the underlying grid structure of a Kolam pattern (Point2D list or (N, 2) array)"""
         if len(points) < 4:
             return {"grid_detected": False}
         
-        # Sort points to find potential grid structure
-        sorted_x = sorted(set(round(p.x, 1) for p in points))
-        sorted_y = sorted(set(round(p.y, 1) for p in points))
+        # Sorted unique rounded coordinates give the potential grid lines
+        coords = points_to_array(points)
+        sorted_x = np.unique(np.round(coords[:, 0], 1))
+        sorted_y = np.unique(np.round(coords[:, 1], 1))
         
         # Calculate potential spacing
-        x_spacings = [sorted_x[i+1] - sorted_x[i] for i in range(len(sorted_x)-1)]
-        y_spacings = [sorted_y[i+1] - sorted_y[i] for i in range(len(sorted_y)-1)]
+        x_spacings = np.diff(sorted_x).tolist()
+        y_spacings = np.diff(sorted_y).tolist()
         
         # Find most common spacing
         x_spacing = self._find_common_spacing(x_spacings) if x_spacings else 1.0
@@ -44,7 +48,7 @@ class PatternRecognizer:
             "cols": len(sorted_x),
             "x_spacing": x_spacing,
             "y_spacing": y_spacing,
-            "origin": Point2D(min(sorted_x), min(sorted_y))
+            "origin": Point2D(float(sorted_x[0]), float(sorted_y[0]))
         }
     
     def _find_common_spacing(self, spacings: List[float]) -> float:
@@ -52,33 +56,41 @@ class PatternRecognizer:
         if not spacings:
             return 1.0
         
-        # Round spacings to avoid floating point issues
-        rounded = [round(s, 2) for s in spacings]
-        spacing_counts = {}
-        
-        for spacing in rounded:
-            spacing_counts[spacing] = spacing_counts.get(spacing, 0) + 1
-        
-        return max(spacing_counts.keys(), key=lambda x: spacing_counts[x])
+        # Round spacings to avoid floating point issues; ties go to the first seen
+        return Counter(round(s, 2) for s in spacings).most_common(1)[0][0]
     
-    def detect_curve_types(self, curve_points: List[Point2D]) -> List[str]:
-        """Detect the types of curves present in a pattern"""
+    def detect_curve_types(self, curve_points) -> List[str]:
+        """Detect the types of curves present in a pattern (Point2D list or (N, 2) array)"""
         if len(curve_points) < 10:
             return ["simple"]
         
+        # Convert once to a contiguous float64 buffer; the checks below are
+        # plain array kernels and never touch Point2D objects
+        curve_points = np.ascontiguousarray(points_to_array(curve_points), dtype=np.float64)
+        
         curve_types = []
         
+        # The centroid and distances to it are computed once and shared by the
+        # circular, spiral and petal checks
+        deltas = curve_points - curve_points.mean(axis=0)
+        distances = np.hypot(deltas[:, 0], deltas[:, 1])
+        
         # Check for circular patterns
-        if self._is_circular_pattern(curve_points):
+        if self._is_circular_pattern(distances):
             curve_types.append("circular")
         
-        # Check for spiral patterns
-        if self._is_spiral_pattern(curve_points):
-            curve_types.append("spiral")
-        
-        # Check for petal/rose patterns
-        if self._is_petal_pattern(curve_points):
-            curve_types.append("petal")
+        # Angles are only needed by the spiral and petal checks, which both
+        # need at least 20 points
+        if len(curve_points) >= 20:
+            angles = np.arctan2(deltas[:, 1], deltas[:, 0])
+            
+            # Check for spiral patterns
+            if self._is_spiral_pattern(angles, distances):
+                curve_types.append("spiral")
+            
+            # Check for petal/rose patterns
+            if self._is_petal_pattern(angles, distances):
+                curve_types.append("petal")
         
         # Check for straight line segments
         if self._has_linear_segments(curve_points):
@@ -86,145 +98,79 @@ class PatternRecognizer:
         
         return curve_types if curve_types else ["complex"]
     
-    def _is_circular_pattern(self, points: List[Point2D]) -> bool:
-        """Check if points form circular arcs"""
-        if len(points) < 10:
+    def _is_circular_pattern(self, distances: np.ndarray) -> bool:
+        """Check if points, given as distances from their centroid, form circular arcs"""
+        if len(distances) < 10:
             return False
         
-        # Calculate center as centroid
-        center = Point2D(
-            sum(p.x for p in points) / len(points),
-            sum(p.y for p in points) / len(points)
-        )
-        
-        # Calculate distances from center
-        distances = [p.distance_to(center) for p in points]
-        avg_distance = sum(distances) / len(distances)
-        
         # Check if distances are roughly equal (circular)
-        variance = sum((d - avg_distance) ** 2 for d in distances) / len(distances)
-        return variance < (avg_distance * 0.1) ** 2
+        return distances.var() < (distances.mean() * 0.1) ** 2
     
-    def _is_spiral_pattern(self, points: List[Point2D]) -> bool:
-        """Check if points form a spiral pattern"""
-        if len(points) < 20:
+    def _is_spiral_pattern(self, angles: np.ndarray, distances: np.ndarray) -> bool:
+        """Check if points, given as polar coordinates around their centroid, form a spiral pattern"""
+        if len(angles) < 20:
             return False
         
-        # Calculate center
-        center = Point2D(
-            sum(p.x for p in points) / len(points),
-            sum(p.y for p in points) / len(points)
-        )
-        
-        # Calculate angles and distances
-        angles = []
-        distances = []
-        
-        for p in points:
-            dx = p.x - center.x
-            dy = p.y - center.y
-            angle = math.atan2(dy, dx)
-            distance = p.distance_to(center)
-            angles.append(angle)
-            distances.append(distance)
-        
         # Check if distances generally increase with angle progression
-        angle_progression = 0
-        distance_trend = 0
-        
-        for i in range(1, len(points)):
-            angle_diff = angles[i] - angles[i-1]
-            # Handle angle wrapping
-            if angle_diff > math.pi:
-                angle_diff -= 2 * math.pi
-            elif angle_diff < -math.pi:
-                angle_diff += 2 * math.pi
-            
-            angle_progression += angle_diff
-            
-            if distances[i] > distances[i-1]:
-                distance_trend += 1
-        
-        return abs(angle_progression) > 2 * math.pi and distance_trend > len(points) * 0.6
+        angle_diffs = np.diff(angles)
+        # Handle angle wrapping without branches: subtract the nearest whole turn
+        # (round-half-even keeps a diff of exactly +/-pi unchanged)
+        angle_diffs -= 2 * math.pi * np.round(angle_diffs / (2 * math.pi))
+        angle_progression = angle_diffs.sum()
+        distance_trend = np.count_nonzero(np.diff(distances) > 0)
+        
+        return abs(angle_progression) > 2 * math.pi and distance_trend > len(angles) * 0.6
     
-    def _is_petal_pattern(self, points: List[Point2D]) -> bool:
-        """Check if points form petal/rose patterns"""
-        if len(points) < 20:
+    def _is_petal_pattern(self, angles: np.ndarray, radii: np.ndarray) -> bool:
+        """Check if points, given as polar coordinates around their centroid, form petal/rose patterns"""
+        if len(angles) < 20:
             return False
         
-        # Calculate center
-        center = Point2D(
-            sum(p.x for p in points) / len(points),
-            sum(p.y for p in points) / len(points)
-        )
-        
-        # Calculate polar coordinates
-        polar_points = []
-        for p in points:
-            dx = p.x - center.x
-            dy = p.y - center.y
-            angle = math.atan2(dy, dx)
-            radius = p.distance_to(center)
-            polar_points.append((angle, radius))
-        
-        # Sort by angle
-        polar_points.sort()
-        
-        # Look for periodic patterns in radius
-        radii = [r for _, r in polar_points]
+        # Sort by angle (ties by radius), then look for periodic patterns in radius
+        radii = radii[np.lexsort((radii, angles))]
         
         # Simple check for multiple local maxima (petals)
-        local_maxima = 0
-        for i in range(1, len(radii) - 1):
-            if radii[i] > radii[i-1] and radii[i] > radii[i+1]:
-                local_maxima += 1
-        
-        return local_maxima >= 4  # At least 4 petals
+        return self._count_peaks(radii) >= 4  # At least 4 petals
     
-    def _has_linear_segments(self, points: List[Point2D]) -> bool:
+    @staticmethod
+    def _count_peaks(values: np.ndarray) -> int:
+        """Count strict interior local maxima of a 1-D array in one vectorized sweep"""
+        inner = values[1:-1]
+        return int(np.count_nonzero((inner > values[:-2]) & (inner > values[2:])))
+    
+    def _has_linear_segments(self, points: np.ndarray) -> bool:
         """Check if curve has linear segments"""
         if len(points) < 6:
             return False
         
-        linear_segments = 0
+        # Least-squares line fit over every 5-point window at once
+        # (windows start at 0..N-6, as the final window has never been tested)
         segment_length = 5
+        xs = sliding_window_view(points[:, 0], segment_length)[:-1]
+        ys = sliding_window_view(points[:, 1], segment_length)[:-1]
         
-        for i in range(len(points) - segment_length):
-            segment = points[i:i+segment_length]
-            if self._is_linear_segment(segment):
-                linear_segments += 1
-        
-        return linear_segments > 0
-    
-    def _is_linear_segment(self, points: List[Point2D]) -> bool:
-        """Check if a small segment of points is approximately linear"""
-        if len(points) < 3:
-            return True
-        
-        # Fit a line using least squares
-        n = len(points)
-        sum_x = sum(p.x for p in points)
-        sum_y = sum(p.y for p in points)
-        sum_xy = sum(p.x * p.y for p in points)
-        sum_x2 = sum(p.x * p.x for p in points)
+        n = segment_length
+        sum_x = xs.sum(axis=1)
+        sum_y = ys.sum(axis=1)
+        sum_xy = (xs * ys).sum(axis=1)
+        sum_x2 = (xs * xs).sum(axis=1)
         
         denom = n * sum_x2 - sum_x * sum_x
-        if abs(denom) < 1e-10:
-            return True  # Vertical line
+        vertical = np.abs(denom) < 1e-10
+        safe_denom = np.where(vertical, 1.0, denom)
         
-        slope = (n * sum_xy - sum_x * sum_y) / denom
+        slope = (n * sum_xy - sum_x * sum_y) / safe_denom
         intercept = (sum_y - slope * sum_x) / n
         
         # Calculate R-squared
         y_mean = sum_y / n
-        ss_tot = sum((p.y - y_mean) ** 2 for p in points)
-        ss_res = sum((p.y - (slope * p.x + intercept)) ** 2 for p in points)
+        ss_tot = ((ys - y_mean[:, None]) ** 2).sum(axis=1)
+        ss_res = ((ys - (slope[:, None] * xs + intercept[:, None])) ** 2).sum(axis=1)
         
-        if ss_tot < 1e-10:
-            return True
+        flat = ss_tot < 1e-10
+        r_squared = 1 - ss_res / np.where(flat, 1.0, ss_tot)
         
-        r_squared = 1 - (ss_res / ss_tot)
-        return r_squared > 0.9
+        return bool(np.any(vertical | flat | (r_squared > 0.9)))
 
 
 class KolamGenerator:
@@ -241,15 +187,13 @@ class KolamGenerator:
         curve_gen = CurveGenerator(pattern.grid)
         
         if dot_pattern == "basic":
-            # Simple rectangular loops
-            for r in range(1, rows-1, 2):
-                for c in range(1, cols-1, 2):
-                    if r < rows-1 and c < cols-1:
-                        square_dots = [
-                            (r, c), (r, c+1), (r+1, c+1), (r+1, c), (r, c)
-                        ]
-                        curve = curve_gen.generate_loop_around_dots(square_dots, 0.4)
-                        pattern.add_curve(curve)
+            # Simple rectangular loops, one 5-dot square template per cell,
+            # all generated in one batch
+            rs, cs = np.meshgrid(np.arange(1, rows-1, 2), np.arange(1, cols-1, 2), indexing="ij")
+            squares = np.stack([rs, cs, rs, cs+1, rs+1, cs+1, rs+1, cs, rs, cs],
+                               axis=-1).reshape(-1, 5, 2)
+            for curve in curve_gen.generate_loops_around_dots(squares, 0.4):
+                pattern.add_curve_array(curve)
         
         elif dot_pattern == "diamond":
             # Diamond shaped loops
@@ -272,7 +216,7 @@ class KolamGenerator:
                 if diamond_dots:
                     diamond_dots.append(diamond_dots[0])
                     curve = curve_gen.generate_loop_around_dots(diamond_dots, 0.3)
-                    pattern.add_curve(curve)
+                    pattern.add_curve_array(curve)
         
         pattern.analyze_symmetries()
         return pattern
@@ -286,12 +230,17 @@ class KolamGenerator:
         curve_gen = CurveGenerator(pattern.grid)
         center = Point2D((size-1) * 1.5 / 2, (size-1) * 1.5 / 2)
         
+        # Shared cos/sin table for angles i * 2pi / complexity, i = 0..complexity
+        # (complexity 0 needs no angles beyond 0, so keep the step finite)
+        angles = np.arange(complexity + 1) * 2 * math.pi / max(complexity, 1)
+        cos_table = np.cos(angles).tolist()
+        sin_table = np.sin(angles).tolist()
+        
         # Generate interlocking spiral patterns
         for i in range(complexity):
-            angle_offset = i * 2 * math.pi / complexity
             spiral_center = Point2D(
-                center.x + (i + 1) * 0.5 * math.cos(angle_offset),
-                center.y + (i + 1) * 0.5 * math.sin(angle_offset)
+                center.x + (i + 1) * 0.5 * cos_table[i],
+                center.y + (i + 1) * 0.5 * sin_table[i]
             )
             
             spiral_curve = curve_gen.generate_spiral_pattern(
@@ -299,25 +248,14 @@ class KolamGenerator:
                 radius=1.0 + i * 0.3, 
                 turns=2 + i * 0.5
             )
-            pattern.add_curve(spiral_curve)
+            pattern.add_curve_array(spiral_curve)
         
-        # Add connecting curves for the knot effect
-        for i in range(complexity):
-            angle1 = i * 2 * math.pi / complexity
-            angle2 = (i + 1) * 2 * math.pi / complexity
-            
-            start = Point2D(
-                center.x + 2 * math.cos(angle1),
-                center.y + 2 * math.sin(angle1)
-            )
-            end = Point2D(
-                center.x + 2 * math.cos(angle2),
-                center.y + 2 * math.sin(angle2)
-            )
-            
-            # Simple connecting curve
-            connecting_curve = self._generate_connecting_curve(start, end)
-            pattern.add_curve(connecting_curve)
+        # Add connecting curves for the knot effect between consecutive anchors
+        # on a radius-2 circle, all evaluated in one batch
+        anchors = np.column_stack([center.x + 2 * np.array(cos_table),
+                                   center.y + 2 * np.array(sin_table)])
+        for connecting_curve in self._generate_connecting_curve(anchors[:-1], anchors[1:]):
+            pattern.add_curve_array(connecting_curve)
         
         pattern.analyze_symmetries()
         return pattern
@@ -329,68 +267,46 @@ class KolamGenerator:
         
         curve_gen = CurveGenerator(pattern.grid)
         
+        coords = pattern.grid.dots_array
+        
         if line_style == "geometric":
-            # Create geometric line patterns
+            # Create geometric line patterns as slices of the (rows, cols, 2) dot array
             # Horizontal lines
             for r in range(0, grid_size, 2):
-                line_points = []
-                for c in range(grid_size):
-                    dot = pattern.grid.get_dot(r, c)
-                    if dot:
-                        line_points.append(dot)
-                if line_points:
-                    pattern.add_curve(line_points)
+                pattern.add_curve_array(coords[r])
             
             # Vertical lines
             for c in range(0, grid_size, 2):
-                line_points = []
-                for r in range(grid_size):
-                    dot = pattern.grid.get_dot(r, c)
-                    if dot:
-                        line_points.append(dot)
-                if line_points:
-                    pattern.add_curve(line_points)
+                pattern.add_curve_array(coords[:, c])
             
             # Diagonal lines
             for offset in range(-(grid_size-1), grid_size):
-                line_points = []
-                for r in range(grid_size):
-                    c = r + offset
-                    if 0 <= c < grid_size:
-                        dot = pattern.grid.get_dot(r, c)
-                        if dot:
-                            line_points.append(dot)
+                line_points = np.diagonal(coords, offset, axis1=0, axis2=1).T
                 if len(line_points) > 1:
-                    pattern.add_curve(line_points)
+                    pattern.add_curve_array(line_points)
         
         elif line_style == "star":
             # Star pattern emanating from center
             center_r, center_c = grid_size // 2, grid_size // 2
-            center_dot = pattern.grid.get_dot(center_r, center_c)
             
-            if center_dot:
-                # Rays in 8 directions
-                directions = [
-                    (-1, -1), (-1, 0), (-1, 1),
-                    (0, -1),           (0, 1),
-                    (1, -1),  (1, 0),  (1, 1)
-                ]
-                
+            # Rays in 8 directions
+            directions = [
+                (-1, -1), (-1, 0), (-1, 1),
+                (0, -1),           (0, 1),
+                (1, -1),  (1, 0),  (1, 1)
+            ]
+            
+            # An empty grid has no center dot to cast rays from
+            if coords.size:
                 for dr, dc in directions:
-                    line_points = [center_dot]
-                    r, c = center_r, center_c
-                    
-                    while True:
-                        r += dr
-                        c += dc
-                        dot = pattern.grid.get_dot(r, c)
-                        if dot:
-                            line_points.append(dot)
-                        else:
-                            break
+                    # Steps until the ray leaves the grid, then gather the dots along it
+                    steps = min(self._ray_steps(center_r, dr, grid_size),
+                                self._ray_steps(center_c, dc, grid_size))
+                    k = np.arange(steps + 1)
+                    line_points = coords[center_r + k * dr, center_c + k * dc]
                     
                     if len(line_points) > 1:
-                        pattern.add_curve(line_points)
+                        pattern.add_curve_array(line_points)
         
         pattern.analyze_symmetries()
         return pattern
@@ -404,24 +320,19 @@ class KolamGenerator:
         curve_gen = CurveGenerator(pattern.grid)
         center = Point2D((grid_size-1) * 0.5, (grid_size-1) * 0.5)
         
-        # Generate multiple layers of petals
-        for layer in range(layers):
-            radius = 1.0 + layer * 0.8
-            petal_curve = curve_gen.generate_petal_pattern(center, radius, num_petals)
-            pattern.add_curve(petal_curve)
+        # Generate multiple layers of petals; the layers share one cos/sin batch
+        radii = 1.0 + np.arange(layers) * 0.8
+        for petal_curve in curve_gen.generate_petal_layers(center, radii, num_petals):
+            pattern.add_curve_array(petal_curve)
         
         # Add center spiral
         center_spiral = curve_gen.generate_spiral_pattern(center, 0.5, 1.5)
-        pattern.add_curve(center_spiral)
+        pattern.add_curve_array(center_spiral)
         
         # Apply symmetry for traditional appearance
-        all_points = []
-        for curve in pattern.curves:
-            all_points.extend(curve)
-        
         # For now, keep the original curves until we implement the symmetry application properly
         # symmetric_points = SymmetryAnalyzer.apply_symmetry(
-        #     all_points, center, SymmetryType.ROTATIONAL_4
+        #     pattern.get_all_points(), center, SymmetryType.ROTATIONAL_4
         # )
         
         pattern.analyze_symmetries()
@@ -436,59 +347,54 @@ class KolamGenerator:
         curve_gen = CurveGenerator(pattern.grid)
         center = Point2D((grid_size-1) * 0.6, (grid_size-1) * 0.6)
         
-        # Generate concentric rings
-        for ring in range(1, rings + 1):
-            radius = ring * 0.8
-            
-            # Circular ring
-            ring_points = []
-            for i in range(segments * 8):
-                angle = i * 2 * math.pi / (segments * 8)
-                x = center.x + radius * math.cos(angle)
-                y = center.y + radius * math.sin(angle)
-                ring_points.append(Point2D(x, y))
-            
-            pattern.add_curve(ring_points)
-            
-            # Add radial spokes for this ring
-            for spoke in range(segments):
-                angle = spoke * 2 * math.pi / segments
-                spoke_points = []
-                
-                # From center to ring
-                for t in range(10):
-                    r = (t / 9) * radius
-                    x = center.x + r * math.cos(angle)
-                    y = center.y + r * math.sin(angle)
-                    spoke_points.append(Point2D(x, y))
-                
-                pattern.add_curve(spoke_points)
+        origin = np.array([center.x, center.y])
+        radii = np.arange(1, rings + 1) * 0.8
+        
+        # Circular rings, shape (rings, segments * 8, 2); the center offset is
+        # added in place here and for the spokes to skip a full-size temporary
+        ring_angles = np.arange(segments * 8) * 2 * math.pi / (segments * 8)
+        ring_dirs = np.column_stack([np.cos(ring_angles), np.sin(ring_angles)])
+        ring_curves = radii[:, None, None] * ring_dirs
+        ring_curves += origin
+        
+        # Radial spokes from center to each ring, shape (rings, segments, 10, 2);
+        # spoke k points along ring direction 8k, so the table is shared
+        spoke_dirs = ring_dirs[::8]
+        spoke_radii = (np.arange(10) / 9) * radii[:, None]
+        spoke_curves = spoke_radii[:, None, :, None] * spoke_dirs[None, :, None, :]
+        spoke_curves += origin
+        
+        # Each ring followed by its spokes
+        for ring_points, spokes in zip(ring_curves, spoke_curves):
+            pattern.add_curve_array(ring_points)
+            for spoke_points in spokes:
+                pattern.add_curve_array(spoke_points)
         
         pattern.analyze_symmetries()
         return pattern
     
-    def _generate_connecting_curve(self, start: Point2D, end: Point2D) -> List[Point2D]:
-        """Generate a smooth connecting curve between two points"""
-        points = []
-        num_points = 20
-        
-        # Simple bezier-like curve
-        for i in range(num_points):
-            t = i / (num_points - 1)
-            
-            # Add some curvature
-            mid_x = (start.x + end.x) / 2
-            mid_y = (start.y + end.y) / 2
-            curve_height = 0.5
-            
-            # Quadratic bezier curve
-            x = (1-t)**2 * start.x + 2*(1-t)*t * mid_x + t**2 * end.x
-            y = (1-t)**2 * start.y + 2*(1-t)*t * (mid_y + curve_height) + t**2 * end.y
-            
-            points.append(Point2D(x, y))
-        
-        return points
-
+    @staticmethod
+    def _ray_steps(start: int, step: int, size: int) -> int:
+        """Number of steps from start in direction step (-1, 0, 1) that stay inside 0..size-1"""
+        if step > 0:
+            return size - 1 - start
+        if step < 0:
+            return start
+        return size
+    
+    def _generate_connecting_curve(self, start: np.ndarray, end: np.ndarray,
+                                   num_points: int = 20) -> np.ndarray:
+        """Generate smooth connecting curves between (..., 2) start and end points, shape (..., num_points, 2)"""
+        start = np.asarray(start, dtype=float)[..., None, :]
+        end = np.asarray(end, dtype=float)[..., None, :]
+        t = (np.arange(num_points) / (num_points - 1))[:, None]
+        
+        # Quadratic bezier through the raised midpoint for some curvature
+        curve_height = 0.5
+        mid = (start + end) / 2
+        mid = mid + np.array([0.0, curve_height])
+        
+        return (1-t)**2 * start + 2*(1-t)*t * mid + t**2 * end
 
 def main():
     """Demonstrate the pattern recognition and generation capabilities"""
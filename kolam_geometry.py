@@ -19,6 +19,11 @@ from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+# Largest transformed x original point-pair count matched by brute force (larger
+# sets go through a spatial hash), and the pair count per cache-sized distance block
+SYMMETRY_BROADCAST_PAIRS = 1_000_000
+SYMMETRY_BLOCK_PAIRS = 65_536
+
 
 class SymmetryType(Enum):
     """Types of symmetry found in Kolam designs"""
@@ -57,7 +62,7 @@ class Point2D:
         return Point2D(self.x * scalar, self.y * scalar)
     
     def distance_to(self, other):
-        return math.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
+        return math.hypot(self.x - other.x, self.y - other.y)
     
     def rotate(self, angle_rad, center=None):
         """Rotate point around center (or origin if None)"""
@@ -77,6 +82,34 @@ class Point2D:
         
         # Translate back
         return rotated + center
+    
+    @classmethod
+    def from_row(cls, coords: np.ndarray, index: int) -> 'Point2D':
+        """Build a Point2D from row index of an (N, 2) coordinate array"""
+        x, y = coords[index].tolist()
+        return cls(x, y)
+
+
+def points_to_array(points) -> np.ndarray:
+    """Convert a Point2D sequence (or an existing array) to an (N, 2) float array"""
+    if isinstance(points, np.ndarray):
+        return points.reshape(-1, 2).astype(float, copy=False)
+    return np.array([(p.x, p.y) for p in points], dtype=float).reshape(-1, 2)
+
+def array_to_points(coords: np.ndarray) -> List[Point2D]:
+    """Convert an (N, 2) coordinate array back to a list of Point2D"""
+    return [Point2D(x, y) for x, y in np.asarray(coords, dtype=float).reshape(-1, 2).tolist()]
+
+def rotate_points(coords: np.ndarray, angle_rad: float, center: Optional[Point2D] = None) -> np.ndarray:
+    """Rotate an (N, 2) coordinate array around center (or origin if None) in one matmul"""
+    cos_a = math.cos(angle_rad)
+    sin_a = math.sin(angle_rad)
+    rotation = np.array([[cos_a, sin_a], [-sin_a, cos_a]])
+    
+    if center is None:
+        return coords @ rotation
+    origin = np.array([center.x, center.y])
+    return (coords - origin) @ rotation + origin
 
 
 class DotGrid:
@@ -86,44 +119,56 @@ class DotGrid:
         self.rows = rows
         self.cols = cols
         self.spacing = spacing
-        self.dots = self._generate_grid()
-        
-    def _generate_grid(self) -> List[List[Point2D]]:
-        """Generate the grid of dots"""
-        grid = []
-        for i in range(self.rows):
-            row = []
-            for j in range(self.cols):
-                x = j * self.spacing
-                y = i * self.spacing
-                row.append(Point2D(x, y))
-            grid.append(row)
-        return grid
+        self._dots_array = None
+        self._dots = None
+    
+    @property
+    def dots(self) -> List[List[Point2D]]:
+        """Dots as Point2D rows, built from dots_array on first access"""
+        if self._dots is None:
+            self._dots = [array_to_points(row) for row in self.dots_array]
+        return self._dots
     
     def get_dot(self, row: int, col: int) -> Optional[Point2D]:
         """Get dot at specific grid position"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            return self.dots[row][col]
+            return Point2D.from_row(self.dots_array[row], col)
         return None
     
     def get_neighbors(self, row: int, col: int, radius: int = 1) -> List[Point2D]:
         """Get neighboring dots within radius"""
-        neighbors = []
-        for dr in range(-radius, radius + 1):
-            for dc in range(-radius, radius + 1):
-                if dr == 0 and dc == 0:
-                    continue
-                dot = self.get_dot(row + dr, col + dc)
-                if dot:
-                    neighbors.append(dot)
-        return neighbors
+        # The (2*radius + 1)^2 window clipped to the grid, as one slice of dots_array
+        r0 = max(0, row - radius)
+        r1 = max(r0, min(self.rows, row + radius + 1))
+        c0 = max(0, col - radius)
+        c1 = max(c0, min(self.cols, col + radius + 1))
+        
+        keep = np.ones((r1 - r0, c1 - c0), dtype=bool)
+        if r0 <= row < r1 and c0 <= col < c1:
+            keep[row - r0, col - c0] = False
+        return array_to_points(self.dots_array[r0:r1, c0:c1][keep])
     
     def get_all_dots(self) -> List[Point2D]:
         """Get all dots as a flat list"""
-        all_dots = []
-        for row in self.dots:
-            all_dots.extend(row)
-        return all_dots
+        return array_to_points(self.get_all_coords())
+    
+    @property
+    def dots_array(self) -> np.ndarray:
+        """Dot coordinates as a cached, read-only (rows, cols, 2) array; [row, col] = (x, y)"""
+        if self._dots_array is None:
+            xs = np.arange(self.cols) * self.spacing
+            ys = np.arange(self.rows) * self.spacing
+            # Negative sizes give an empty grid, as the range loops they replace did
+            dots_array = np.empty((max(self.rows, 0), max(self.cols, 0), 2))
+            dots_array[..., 0] = xs
+            dots_array[..., 1] = ys[:, None]
+            dots_array.flags.writeable = False
+            self._dots_array = dots_array
+        return self._dots_array
+    
+    def get_all_coords(self) -> np.ndarray:
+        """Get all dot coordinates as a cached (rows*cols, 2) array, row-major"""
+        return self.dots_array.reshape(-1, 2)
 
 
 class CurveGenerator:
@@ -133,78 +178,95 @@ class CurveGenerator:
         self.grid = grid
     
     def generate_loop_around_dots(self, dot_positions: List[Tuple[int, int]], 
-                                 curve_radius: float = 0.3) -> List[Point2D]:
+                                 curve_radius: float = 0.3) -> np.ndarray:
         """
         Generate a continuous curve that loops around specified dots
         This follows the traditional Kolam principle of unbroken lines
         """
-        if not dot_positions:
-            return []
+        positions = np.asarray(dot_positions, dtype=int).reshape(-1, 2)
         
-        curve_points = []
+        # Positions off the grid contribute no arc
+        on_grid = ((positions >= 0) & (positions < (self.grid.rows, self.grid.cols))).all(axis=1)
+        rows, cols = np.where(on_grid[:, None], positions, 0).T
+        dots = self.grid.dots_array[rows, cols]
         
-        for i, (row, col) in enumerate(dot_positions):
-            dot = self.grid.get_dot(row, col)
-            if not dot:
-                continue
-                
-            # Generate circular arc around each dot
-            num_points = 20
-            start_angle = 0
-            end_angle = 2 * math.pi
-            
-            if i < len(dot_positions) - 1:
-                # Connect to next dot
-                next_dot = self.grid.get_dot(dot_positions[i + 1][0], dot_positions[i + 1][1])
-                if next_dot:
-                    # Calculate angle towards next dot
-                    dx = next_dot.x - dot.x
-                    dy = next_dot.y - dot.y
-                    angle_to_next = math.atan2(dy, dx)
-                    start_angle = angle_to_next + math.pi/2
-                    end_angle = start_angle + 3*math.pi/2
-            
-            for j in range(num_points):
-                angle = start_angle + (end_angle - start_angle) * j / (num_points - 1)
-                x = dot.x + curve_radius * math.cos(angle)
-                y = dot.y + curve_radius * math.sin(angle)
-                curve_points.append(Point2D(x, y))
-        
-        return curve_points
+        # An arc opens towards the next dot when that one is on the grid too
+        opens = np.zeros(len(positions), dtype=bool)
+        opens[:-1] = on_grid[1:]
+        
+        return self._arcs_around(dots, opens, curve_radius)[on_grid].reshape(-1, 2)
+    
+    def generate_loops_around_dots(self, dot_positions: np.ndarray,
+                                   curve_radius: float = 0.3) -> np.ndarray:
+        """
+        Batched generate_loop_around_dots for K loops over M dots each
+        dot_positions is a (K, M, 2) integer array of (row, col) pairs that all lie
+        on the grid; returns the curves as a (K, M * 20, 2) array
+        """
+        dot_positions = np.asarray(dot_positions, dtype=int)
+        dots = self.grid.dots_array[dot_positions[..., 0], dot_positions[..., 1]]
+        
+        # Every arc but the last of each loop opens towards the next dot
+        opens = np.ones(dots.shape[:2], dtype=bool)
+        opens[:, -1:] = False
+        
+        arcs = self._arcs_around(dots, opens, curve_radius)
+        return arcs.reshape(dots.shape[0], dots.shape[1] * arcs.shape[-2], 2)
+    
+    @staticmethod
+    def _arcs_around(dots: np.ndarray, opens: np.ndarray, curve_radius: float) -> np.ndarray:
+        """
+        Sample a 20-point arc around each of the (..., M, 2) dots, shape (..., M, 20, 2)
+        Where opens is set the arc spans 3/4 of a turn, starting perpendicular to the
+        direction of the following dot; elsewhere it is a full circle
+        """
+        num_points = 20
+        
+        deltas = np.zeros_like(dots)
+        deltas[..., :-1, :] = dots[..., 1:, :] - dots[..., :-1, :]
+        toward_next = np.arctan2(deltas[..., 1], deltas[..., 0]) + math.pi/2
+        start_angles = np.where(opens, toward_next, 0.0)
+        end_angles = np.where(opens, toward_next + 3*math.pi/2, 2 * math.pi)
+        
+        steps = np.arange(num_points)
+        angles = start_angles[..., None] + (end_angles - start_angles)[..., None] * steps / (num_points - 1)
+        arcs = np.empty(angles.shape + (2,))
+        arcs[..., 0] = dots[..., 0, None] + curve_radius * np.cos(angles)
+        arcs[..., 1] = dots[..., 1, None] + curve_radius * np.sin(angles)
+        return arcs
     
     def generate_spiral_pattern(self, center: Point2D, radius: float, 
-                               turns: float = 3) -> List[Point2D]:
-        """Generate spiral patterns common in Kolam designs"""
-        points = []
+                               turns: float = 3) -> np.ndarray:
+        """Generate spiral patterns common in Kolam designs, as an (N, 2) array"""
         num_points = int(100 * turns)
         
-        for i in range(num_points):
-            t = i / num_points
-            angle = t * turns * 2 * math.pi
-            r = radius * t
-            
-            x = center.x + r * math.cos(angle)
-            y = center.y + r * math.sin(angle)
-            points.append(Point2D(x, y))
+        t = np.arange(num_points) / num_points
+        angle = t * turns * 2 * math.pi
+        r = radius * t
         
+        points = np.empty((num_points, 2))
+        points[:, 0] = center.x + r * np.cos(angle)
+        points[:, 1] = center.y + r * np.sin(angle)
         return points
     
     def generate_petal_pattern(self, center: Point2D, radius: float, 
-                              num_petals: int = 8) -> List[Point2D]:
-        """Generate petal patterns using rose curves"""
-        points = []
+                              num_petals: int = 8) -> np.ndarray:
+        """Generate petal patterns using rose curves, as an (N, 2) array"""
+        return self.generate_petal_layers(center, [radius], num_petals)[0]
+    
+    def generate_petal_layers(self, center: Point2D, radii, 
+                              num_petals: int = 8) -> np.ndarray:
+        """Generate concentric rose curves sharing one trig evaluation, as an (L, N, 2) array"""
         num_points = 200
         
-        for i in range(num_points):
-            t = i / num_points * 2 * math.pi
-            # Rose curve equation: r = radius * cos(k*t) where k = num_petals/2
-            k = num_petals / 2
-            r = radius * abs(math.cos(k * t))
-            
-            x = center.x + r * math.cos(t)
-            y = center.y + r * math.sin(t)
-            points.append(Point2D(x, y))
+        t = np.arange(num_points) / num_points * 2 * math.pi
+        # Rose curve equation: r = radius * cos(k*t) where k = num_petals/2
+        k = num_petals / 2
+        r = np.asarray(radii, dtype=float)[:, None] * np.abs(np.cos(k * t))
         
+        points = np.empty(r.shape + (2,))
+        points[..., 0] = center.x + r * np.cos(t)
+        points[..., 1] = center.y + r * np.sin(t)
         return points
 
 
@@ -212,89 +274,164 @@ class SymmetryAnalyzer:
     """Analyzes and applies symmetry operations to Kolam patterns"""
     
     @staticmethod
-    def detect_symmetries(points: List[Point2D]) -> List[SymmetryType]:
-        """Detect symmetries in a given set of points"""
+    def detect_symmetries(points, centroid: Optional[Point2D] = None) -> List[SymmetryType]:
+        """Detect symmetries in a set of points (Point2D list or (N, 2) array) about their centroid"""
         symmetries = []
         
-        if not points:
+        points = points_to_array(points)
+        if len(points) == 0:
             return symmetries
         
-        # Calculate centroid
-        centroid = Point2D(
-            sum(p.x for p in points) / len(points),
-            sum(p.y for p in points) / len(points)
-        )
+        # Calculate centroid unless the caller already has it
+        if centroid is None:
+            centroid = Point2D(*points.mean(axis=0))
+        
+        # Points extreme along a fan of directions (convex hull vertices) are tested
+        # first: a candidate that moves them off the pattern is rejected without
+        # transforming every point
+        probe = SymmetryAnalyzer._hull_probe(points)
         
         # Test for rotational symmetry
         for fold in [2, 4, 8]:
-            if SymmetryAnalyzer._test_rotational_symmetry(points, centroid, fold):
+            if (SymmetryAnalyzer._test_rotational_symmetry(points, centroid, fold, subset=probe) and
+                    SymmetryAnalyzer._test_rotational_symmetry(points, centroid, fold)):
                 symmetries.append(getattr(SymmetryType, f"ROTATIONAL_{fold}"))
         
         # Test for reflectional symmetry
-        if SymmetryAnalyzer._test_reflection_symmetry(points, centroid, "vertical"):
-            symmetries.append(SymmetryType.REFLECTIONAL_VERTICAL)
-        if SymmetryAnalyzer._test_reflection_symmetry(points, centroid, "horizontal"):
-            symmetries.append(SymmetryType.REFLECTIONAL_HORIZONTAL)
+        for axis, symmetry in (("vertical", SymmetryType.REFLECTIONAL_VERTICAL),
+                               ("horizontal", SymmetryType.REFLECTIONAL_HORIZONTAL)):
+            if (SymmetryAnalyzer._test_reflection_symmetry(points, centroid, axis, subset=probe) and
+                    SymmetryAnalyzer._test_reflection_symmetry(points, centroid, axis)):
+                symmetries.append(symmetry)
         
         return symmetries
     
     @staticmethod
-    def _test_rotational_symmetry(points: List[Point2D], center: Point2D, 
-                                 fold: int, tolerance: float = 0.1) -> bool:
-        """Test if points have n-fold rotational symmetry"""
-        angle = 2 * math.pi / fold
-        rotated_points = [p.rotate(angle, center) for p in points]
-        
-        # Check if rotated points match original points (within tolerance)
-        for rp in rotated_points:
-            found_match = False
-            for op in points:
-                if rp.distance_to(op) < tolerance:
-                    found_match = True
-                    break
-            if not found_match:
-                return False
-        return True
+    def _hull_probe(points: np.ndarray, directions: int = 16) -> np.ndarray:
+        """Points extreme along evenly spaced directions, a subset of the convex hull vertices"""
+        angles = np.arange(directions) * 2 * math.pi / directions
+        extents = points @ np.stack([np.cos(angles), np.sin(angles)])
+        return points[np.unique(extents.argmax(axis=0))]
     
     @staticmethod
-    def _test_reflection_symmetry(points: List[Point2D], center: Point2D, 
-                                 axis: str, tolerance: float = 0.1) -> bool:
-        """Test if points have reflection symmetry along specified axis"""
+    def _test_rotational_symmetry(points: np.ndarray, center: Point2D, 
+                                 fold: int, tolerance: float = 0.1,
+                                 subset: Optional[np.ndarray] = None) -> bool:
+        """Test if points (or just subset of them) map onto points under n-fold rotation"""
+        if subset is None:
+            subset = points
+        
+        rotated_points = rotate_points(subset, 2 * math.pi / fold, center)
+        
+        return SymmetryAnalyzer._points_match(rotated_points, points, tolerance)
+    
+    @staticmethod
+    def _test_reflection_symmetry(points: np.ndarray, center: Point2D, 
+                                 axis: str, tolerance: float = 0.1,
+                                 subset: Optional[np.ndarray] = None) -> bool:
+        """Test if points (or just subset of them) map onto points under reflection along axis"""
+        if subset is None:
+            subset = points
+        
+        reflected_points = subset.copy()
         if axis == "vertical":
-            reflected_points = [Point2D(2*center.x - p.x, p.y) for p in points]
+            reflected_points[:, 0] = 2*center.x - subset[:, 0]
         elif axis == "horizontal":
-            reflected_points = [Point2D(p.x, 2*center.y - p.y) for p in points]
+            reflected_points[:, 1] = 2*center.y - subset[:, 1]
         else:
             return False
         
-        # Check if reflected points match original points (within tolerance)
-        for rp in reflected_points:
-            found_match = False
-            for op in points:
-                if rp.distance_to(op) < tolerance:
-                    found_match = True
-                    break
-            if not found_match:
-                return False
-        return True
+        return SymmetryAnalyzer._points_match(reflected_points, points, tolerance)
+    
+    @staticmethod
+    def _points_match(transformed: np.ndarray, points: np.ndarray, 
+                      tolerance: float) -> bool:
+        """Check every transformed point lies within tolerance of an original point"""
+        tolerance_sq = tolerance ** 2
+        xs = points[:, 0]
+        ys = points[:, 1]
+        
+        if len(transformed) * len(points) <= SYMMETRY_BROADCAST_PAIRS:
+            # Squared distances from blocks of transformed points to every original
+            # point; blocks stay cache-sized and the first unmatched block stops the test
+            block = max(1, SYMMETRY_BLOCK_PAIRS // len(points))
+            for start in range(0, len(transformed), block):
+                chunk = transformed[start:start + block]
+                dist_sq = (chunk[:, 0, None] - xs) ** 2 + (chunk[:, 1, None] - ys) ** 2
+                if dist_sq.min(axis=1).max() >= tolerance_sq:
+                    return False
+            return True
+        
+        return SymmetryAnalyzer._points_match_hashed(transformed, points, tolerance)
     
     @staticmethod
-    def apply_symmetry(points: List[Point2D], center: Point2D, 
-                      symmetry_type: SymmetryType) -> List[Point2D]:
-        """Apply symmetry transformation to create symmetric patterns"""
+    def _points_match_hashed(transformed: np.ndarray, points: np.ndarray, 
+                             tolerance: float) -> bool:
+        """
+        Spatial-hash variant of _points_match for large point sets
+        Originals are bucketed into tolerance-sized cells, so each transformed point
+        is only compared against the 3x3 block of cells around it
+        """
+        tolerance_sq = tolerance ** 2
+        
+        # Cell coordinates relative to an origin one cell below both point sets,
+        # so neighbour cells never go negative
+        origin = np.minimum(points.min(axis=0), transformed.min(axis=0)) - tolerance
+        cells = np.floor((points - origin) / tolerance).astype(np.int64)
+        query_cells = np.floor((transformed - origin) / tolerance).astype(np.int64)
+        stride = int(max(cells[:, 1].max(), query_cells[:, 1].max())) + 2
+        
+        # Originals sorted by cell key; each cell is then a contiguous run
+        keys = cells[:, 0] * stride + cells[:, 1]
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        xs = points[order, 0]
+        ys = points[order, 1]
+        
+        best = np.full(len(transformed), np.inf)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                neighbour = (query_cells[:, 0] + dx) * stride + query_cells[:, 1] + dy
+                lo = np.searchsorted(keys, neighbour, side="left")
+                counts = np.searchsorted(keys, neighbour, side="right") - lo
+                hit = counts > 0
+                if not hit.any():
+                    continue
+                
+                # Flatten the candidate runs, one segment per transformed point
+                counts = counts[hit]
+                seg_starts = np.cumsum(counts) - counts
+                candidates = (np.arange(counts.sum()) - np.repeat(seg_starts, counts)
+                              + np.repeat(lo[hit], counts))
+                dist_sq = ((xs[candidates] - np.repeat(transformed[hit, 0], counts)) ** 2 +
+                           (ys[candidates] - np.repeat(transformed[hit, 1], counts)) ** 2)
+                best[hit] = np.minimum(best[hit], np.minimum.reduceat(dist_sq, seg_starts))
+        
+        return bool(best.max() < tolerance_sq)
+    
+    @staticmethod
+    def apply_symmetry(points, center: Point2D, 
+                      symmetry_type: SymmetryType) -> np.ndarray:
+        """Apply symmetry transformation to create symmetric patterns, as an (N * k, 2) array"""
+        points = points_to_array(points)
         if symmetry_type == SymmetryType.ROTATIONAL_4:
-            all_points = list(points)
-            for i in range(1, 4):
-                angle = i * math.pi / 2
-                rotated = [p.rotate(angle, center) for p in points]
-                all_points.extend(rotated)
-            return all_points
+            # Quarter, half and three-quarter turns as one (3, 2, 2) stack of
+            # row-vector rotation matrices, applied in a single einsum
+            angles = np.arange(1, 4) * math.pi / 2
+            cos_a, sin_a = np.cos(angles), np.sin(angles)
+            rotations = np.stack([np.stack([cos_a, sin_a], axis=-1),
+                                  np.stack([-sin_a, cos_a], axis=-1)], axis=-2)
+            origin = np.array([center.x, center.y])
+            rotated = np.einsum('nj,kji->kni', points - origin, rotations) + origin
+            return np.concatenate([points, rotated.reshape(-1, 2)])
         elif symmetry_type == SymmetryType.REFLECTIONAL_VERTICAL:
-            reflected = [Point2D(2*center.x - p.x, p.y) for p in points]
-            return points + reflected
+            reflected = points.copy()
+            reflected[:, 0] = 2*center.x - points[:, 0]
+            return np.concatenate([points, reflected])
         elif symmetry_type == SymmetryType.REFLECTIONAL_HORIZONTAL:
-            reflected = [Point2D(p.x, 2*center.y - p.y) for p in points]
-            return points + reflected
+            reflected = points.copy()
+            reflected[:, 1] = 2*center.y - points[:, 1]
+            return np.concatenate([points, reflected])
         
         return points
 
@@ -307,41 +444,75 @@ class KolamPattern:
         self.kolam_type = kolam_type
         self.grid = None
         self.curves = []
-        self.symmetries = []
         self.properties = {}
+        self._symmetries = []
+        self._all_points = None
+        self._bbox = None
+        self._centroid = None
+        self._symmetries_analyzed = False
     
     def set_grid(self, rows: int, cols: int, spacing: float = 1.0):
         """Set the underlying dot grid"""
         self.grid = DotGrid(rows, cols, spacing)
     
     def add_curve(self, curve_points: List[Point2D]):
-        """Add a curve to the pattern"""
-        self.curves.append(curve_points)
+        """Add a curve to the pattern, stored as an (N, 2) coordinate array"""
+        self.add_curve_array(points_to_array(curve_points))
+    
+    def add_curve_array(self, coords: np.ndarray):
+        """Add a curve given directly as an (N, 2) coordinate array"""
+        self.curves.append(np.asarray(coords, dtype=float).reshape(-1, 2))
+        self._all_points = None
+        self._bbox = None
+        self._centroid = None
+        self._symmetries_analyzed = False
     
     def analyze_symmetries(self):
-        """Analyze symmetries in the pattern"""
-        all_points = []
-        for curve in self.curves:
-            all_points.extend(curve)
+        """Analyze symmetries in the pattern (no-op if curves are unchanged since the last run)"""
+        if self._symmetries_analyzed:
+            return
+        
+        all_points = self.get_all_points()
         
-        if all_points:
-            self.symmetries = SymmetryAnalyzer.detect_symmetries(all_points)
+        if len(all_points):
+            self._symmetries = SymmetryAnalyzer.detect_symmetries(all_points, self.get_centroid())
+        self._symmetries_analyzed = True
+    
+    @property
+    def symmetries(self) -> List[SymmetryType]:
+        """Detected symmetries, analyzed lazily on first access after the curves change"""
+        self.analyze_symmetries()
+        return self._symmetries
+    
+    def get_all_points(self) -> np.ndarray:
+        """Get all curve points as an (N, 2) array, cached until curves change"""
+        if self._all_points is None:
+            self._all_points = (np.concatenate(self.curves) if self.curves
+                                else np.empty((0, 2)))
+        return self._all_points
     
     def get_bounding_box(self) -> Tuple[Point2D, Point2D]:
-        """Get bounding box of the pattern"""
-        if not self.curves:
-            return Point2D(0, 0), Point2D(0, 0)
-        
-        all_points = []
-        for curve in self.curves:
-            all_points.extend(curve)
-        
-        min_x = min(p.x for p in all_points)
-        max_x = max(p.x for p in all_points)
-        min_y = min(p.y for p in all_points)
-        max_y = max(p.y for p in all_points)
-        
-        return Point2D(min_x, min_y), Point2D(max_x, max_y)
+        """Get bounding box of the pattern, cached until curves change"""
+        if self._bbox is None:
+            all_points = self.get_all_points()
+            if len(all_points) == 0:
+                self._bbox = Point2D(0, 0), Point2D(0, 0)
+            else:
+                min_x, min_y = all_points.min(axis=0)
+                max_x, max_y = all_points.max(axis=0)
+                self._bbox = (Point2D(float(min_x), float(min_y)),
+                              Point2D(float(max_x), float(max_y)))
+        return self._bbox
+    
+    def get_centroid(self) -> Point2D:
+        """Get the mean of all curve points, cached until curves change"""
+        if self._centroid is None:
+            all_points = self.get_all_points()
+            if len(all_points) == 0:
+                self._centroid = Point2D(0, 0)
+            else:
+                self._centroid = Point2D(*all_points.mean(axis=0).tolist())
+        return self._centroid
 
 
 def main():
@@ -369,7 +540,7 @@ def main():
     # Create a pattern and analyze it
     pattern = KolamPattern("Sample Square Loop", KolamType.PULLI_KOLAM)
     pattern.set_grid(5, 5, 2.0)
-    pattern.add_curve(loop_curve)
+    pattern.add_curve_array(loop_curve)
     pattern.analyze_symmetries()
     
     print(f"Pattern symmetries: {[s.value for s in pattern.symmetries]}")
@@ -8,13 +8,19 @@ It can render patterns to screen, save as images (PNG, JPEG), or export as SVG.
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 import numpy as np
+from PIL import Image, ImageDraw
 from typing import List, Tuple, Optional, Dict
 import os
 from kolam_geometry import Point2D, KolamPattern, DotGrid
 from kolam_generator import KolamGenerator
 
+# Inches kept above the save_pattern axes for the 14pt title and its 20pt pad
+SAVE_TITLE_HEADROOM = 0.6
+
 
 class KolamVisualizer:
     """Visualizes Kolam patterns using matplotlib"""
@@ -29,6 +35,32 @@ class KolamVisualizer:
             'symmetry': '#4169E1'   # Royal Blue
         }
         
+        # Off-screen figure reused by save_pattern, created on first save
+        self._save_fig = None
+        self._save_ax = None
+    
+    def _get_save_axes(self) -> Tuple[Figure, plt.Axes]:
+        """Get the reusable Agg figure/axes for file output, cleared and ready to draw"""
+        if self._save_fig is None:
+            # Not registered with pyplot, so no GUI window or event loop is involved
+            self._save_fig = Figure(figsize=self.figsize)
+            FigureCanvasAgg(self._save_fig)
+            self._save_ax = self._save_fig.add_subplot(111)
+            
+            # Fixed layout: the axes fills the figure below the title headroom, so
+            # saves need neither tight_layout nor a bbox_inches='tight' pass
+            self._save_fig.subplots_adjust(
+                left=0, right=1, bottom=0,
+                top=1 - SAVE_TITLE_HEADROOM / self._save_fig.get_figheight())
+        
+        self._save_ax.cla()
+        return self._save_fig, self._save_ax
+    
+    def close(self) -> None:
+        """Release the figure reused by save_pattern"""
+        self._save_fig = None
+        self._save_ax = None
+    
     def visualize_pattern(self, pattern: KolamPattern, show_grid: bool = True, 
                          show_dots: bool = True, show_symmetry: bool = False,
                          title: Optional[str] = None) -> None:
@@ -64,7 +96,7 @@ class KolamVisualizer:
                     show_grid: bool = True, show_dots: bool = True,
                     dpi: int = 300, format: str = 'png') -> None:
         """Save a Kolam pattern to file"""
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._get_save_axes()
         
         # Set background color
         fig.patch.set_facecolor(self.colors['background'])
@@ -82,10 +114,43 @@ class KolamVisualizer:
         # Customize appearance
         self._customize_plot(ax, pattern, pattern.name)
         
-        plt.tight_layout()
-        plt.savefig(filename, dpi=dpi, format=format, bbox_inches='tight', 
-                   facecolor=self.colors['background'])
-        plt.close()
+        fig.savefig(filename, dpi=dpi, format=format, 
+                    facecolor=self.colors['background'])
+        print(f"Pattern saved as: {filename}")
+    
+    def save_pattern_fast(self, pattern: KolamPattern, filename: str, size: int = 1024,
+                          show_dots: bool = True) -> None:
+        """Save an unlabeled PNG of the pattern by rasterizing it directly with Pillow
+        
+        Skips the matplotlib artist pipeline entirely; use save_pattern for titled
+        or high-DPI output.
+        """
+        # Same extent as _customize_plot: bounding box plus margin, longest side = size px
+        bbox_min, bbox_max = pattern.get_bounding_box()
+        margin = 0.5
+        origin = np.array([bbox_min.x - margin, bbox_max.y + margin])
+        width = bbox_max.x - bbox_min.x + 2 * margin
+        height = bbox_max.y - bbox_min.y + 2 * margin
+        scale = np.array([1, -1]) * size / max(width, height)
+        
+        image = Image.new('RGB', (int(np.ceil(width * abs(scale[0]))),
+                                  int(np.ceil(height * abs(scale[0])))),
+                          self.colors['background'])
+        draw = ImageDraw.Draw(image)
+        
+        if show_dots and pattern.grid:
+            radius = max(2, size // 200)
+            for x, y in ((pattern.grid.get_all_coords() - origin) * scale).tolist():
+                draw.ellipse((x - radius, y - radius, x + radius, y + radius),
+                             fill=self.colors['dots'])
+        
+        line_width = max(2, size // 300)
+        for curve in pattern.curves:
+            if len(curve) > 1:
+                draw.line(((curve - origin) * scale).ravel().tolist(),
+                          fill=self.colors['curves'], width=line_width, joint='curve')
+        
+        image.save(filename, optimize=True)
         print(f"Pattern saved as: {filename}")
     
     def export_svg(self, pattern: KolamPattern, filename: str) -> None:
@@ -98,8 +163,8 @@ class KolamVisualizer:
         width = bbox_max.x - bbox_min.x + 2
         height = bbox_max.y - bbox_min.y + 2
         
-        # Create SVG content
-        svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+        # Create SVG content as a list of parts, joined once at the end
+        svg_parts = [f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" 
      width="{width*50}" height="{height*50}" 
      viewBox="{bbox_min.x-1} {bbox_min.y-1} {width} {height}">
@@ -107,30 +172,28 @@ class KolamVisualizer:
   <rect width="100%" height="100%" fill="#FFF8DC"/>
   
   <!-- Grid dots -->
-'''
+''']
         
         # Add dots
         if pattern.grid:
-            for dot in pattern.grid.get_all_dots():
-                svg_content += f'  <circle cx="{dot.x}" cy="{dot.y}" r="0.05" fill="#8B4513"/>\n'
+            svg_parts.extend(f'  <circle cx="{x}" cy="{y}" r="0.05" fill="#8B4513"/>\n'
+                             for x, y in pattern.grid.get_all_coords().tolist())
         
-        svg_content += '\n  <!-- Curves -->\n'
+        svg_parts.append('\n  <!-- Curves -->\n')
         
         # Add curves
-        for i, curve in enumerate(pattern.curves):
-            if curve:
-                path_data = f'M {curve[0].x},{curve[0].y}'
-                for point in curve[1:]:
-                    path_data += f' L {point.x},{point.y}'
+        for curve in pattern.curves:
+            if len(curve):
+                path_data = 'M ' + ' L '.join(f'{x},{y}' for x, y in curve.tolist())
                 
-                svg_content += f'''  <path d="{path_data}" 
+                svg_parts.append(f'''  <path d="{path_data}" 
                     stroke="#FF4500" stroke-width="0.08" 
-                    fill="none" stroke-linecap="round"/>\n'''
+                    fill="none" stroke-linecap="round"/>\n''')
         
-        svg_content += '\n</svg>'
+        svg_parts.append('\n</svg>')
         
         with open(filename, 'w') as f:
-            f.write(svg_content)
+            f.write(''.join(svg_parts))
         print(f"SVG exported as: {filename}")
     
     def create_comparison_plot(self, patterns: List[KolamPattern], 
@@ -172,88 +235,85 @@ class KolamVisualizer:
         """Create an animated visualization of pattern generation"""
         # This is a simplified animation - in practice, you'd use matplotlib.animation
         fig, ax = plt.subplots(figsize=self.figsize)
+        ax.set_facecolor(self.colors['background'])
         
-        # Collect all curve points
-        all_points = []
-        curve_boundaries = [0]
+        # Dots, styling and limits are set up once; each step only swaps the
+        # segments of one persistent curve collection and the title text
+        if pattern.grid:
+            self._draw_dots(ax, pattern.grid, alpha=0.3)
+        curve_artist = LineCollection([], colors=self.colors['curves'], linewidths=2.0,
+                                      alpha=0.8, capstyle='projecting', zorder=10)
+        ax.add_collection(curve_artist, autolim=False)
+        self._customize_plot(ax, pattern, f"{pattern.name} - Step 1")
         
-        for curve in pattern.curves:
-            all_points.extend(curve)
-            curve_boundaries.append(len(all_points))
+        # Offset of each curve's first point in the concatenated point sequence
+        all_points = pattern.get_all_points()
+        curve_starts = np.cumsum([0] + [len(curve) for curve in pattern.curves[:-1]])
         
         # Show progressive revelation
         points_per_step = max(1, len(all_points) // steps)
         
         for step in range(0, len(all_points), points_per_step):
-            ax.clear()
-            ax.set_facecolor(self.colors['background'])
+            # Draw curves up to current step, each cut at the revealed point count
+            shown = step + points_per_step
+            curve_artist.set_segments([
+                curve[:shown - start] for curve, start in zip(pattern.curves, curve_starts)
+                if shown - start > 1 and len(curve) > 1
+            ])
             
-            # Draw grid and dots
-            if pattern.grid:
-                self._draw_dots(ax, pattern.grid, alpha=0.3)
-            
-            # Draw curves up to current step
-            current_points = all_points[:step + points_per_step]
-            if current_points:
-                # Split back into curves
-                curve_idx = 0
-                for i in range(len(curve_boundaries) - 1):
-                    start = curve_boundaries[i]
-                    end = min(curve_boundaries[i + 1], len(current_points))
-                    
-                    if start < len(current_points):
-                        curve_section = current_points[start:end]
-                        if len(curve_section) > 1:
-                            self._draw_curves(ax, [curve_section], alpha=0.8)
-            
-            self._customize_plot(ax, pattern, f"{pattern.name} - Step {step//points_per_step + 1}")
+            ax.title.set_text(f"{pattern.name} - Step {step//points_per_step + 1}")
             plt.pause(0.1)
         
         plt.show()
     
     def _draw_grid(self, ax, grid: DotGrid, alpha: float = 0.3) -> None:
-        """Draw the underlying grid structure"""
+        """Draw the underlying grid structure as two line collections"""
+        # Like axvline/axhline, each line spans the whole axes: x (or y) is in data
+        # coordinates and the other end runs 0..1 in axes coordinates
+        span = np.array([0.0, 1.0])
+        
         # Vertical lines
-        for col in range(grid.cols):
-            x = col * grid.spacing
-            ax.axvline(x, color=self.colors['grid'], alpha=alpha, linewidth=0.5)
+        xs = np.arange(grid.cols) * grid.spacing
+        vertical = np.empty((len(xs), 2, 2))
+        vertical[..., 0] = xs[:, None]
+        vertical[..., 1] = span
         
         # Horizontal lines
-        for row in range(grid.rows):
-            y = row * grid.spacing
-            ax.axhline(y, color=self.colors['grid'], alpha=alpha, linewidth=0.5)
+        ys = np.arange(grid.rows) * grid.spacing
+        horizontal = np.empty((len(ys), 2, 2))
+        horizontal[..., 0] = span
+        horizontal[..., 1] = ys[:, None]
+        
+        for segments, transform in ((vertical, ax.get_xaxis_transform()),
+                                    (horizontal, ax.get_yaxis_transform())):
+            ax.add_collection(LineCollection(segments, colors=self.colors['grid'], alpha=alpha,
+                                             linewidths=0.5, transform=transform),
+                              autolim=False)
     
     def _draw_dots(self, ax, grid: DotGrid, size: int = 30, alpha: float = 1.0) -> None:
-        """Draw the grid dots"""
-        for dot in grid.get_all_dots():
-            ax.scatter(dot.x, dot.y, s=size, c=self.colors['dots'], 
-                      alpha=alpha, zorder=5)
+        """Draw the grid dots as a single scatter collection"""
+        coords = grid.get_all_coords()
+        ax.scatter(coords[:, 0], coords[:, 1], s=size, c=self.colors['dots'], 
+                  alpha=alpha, zorder=5)
     
-    def _draw_curves(self, ax, curves: List[List[Point2D]], 
+    def _draw_curves(self, ax, curves: List[np.ndarray], 
                     linewidth: float = 2.0, alpha: float = 1.0) -> None:
-        """Draw the pattern curves"""
-        for curve in curves:
-            if len(curve) > 1:
-                x_coords = [p.x for p in curve]
-                y_coords = [p.y for p in curve]
-                ax.plot(x_coords, y_coords, color=self.colors['curves'], 
-                       linewidth=linewidth, alpha=alpha, zorder=10)
+        """Draw the pattern curves as a single line collection"""
+        segments = [curve for curve in curves if len(curve) > 1]
+        if segments:
+            # Projecting caps, as ax.plot lines would have
+            ax.add_collection(LineCollection(segments, colors=self.colors['curves'],
+                                             linewidths=linewidth, alpha=alpha,
+                                             capstyle='projecting', zorder=10))
     
     def _draw_symmetry_indicators(self, ax, pattern: KolamPattern) -> None:
         """Draw indicators for detected symmetries"""
-        if not pattern.curves:
-            return
-        
-        # Calculate pattern center
-        all_points = []
-        for curve in pattern.curves:
-            all_points.extend(curve)
-        
-        if not all_points:
+        if not len(pattern.get_all_points()):
             return
         
-        center_x = sum(p.x for p in all_points) / len(all_points)
-        center_y = sum(p.y for p in all_points) / len(all_points)
+        # Pattern center and bounding box, both cached on the pattern
+        center = pattern.get_centroid()
+        center_x, center_y = center.x, center.y
         
         # Get bounding box for symmetry lines
         bbox_min, bbox_max = pattern.get_bounding_box()
@@ -305,7 +365,7 @@ class KolamVisualizer:
             'type': pattern.kolam_type.value,
             'symmetries': [s.value for s in pattern.symmetries],
             'curves_count': len(pattern.curves),
-            'total_points': sum(len(curve) for curve in pattern.curves),
+            'total_points': len(pattern.get_all_points()),
         }
         
         if pattern.grid:
@@ -421,6 +481,7 @@ def main():
     print("\nCreating comparison plot...")
     visualizer.create_comparison_plot(patterns[:4], cols=2)
     
+    visualizer.close()
     print(f"\nAll outputs saved to: {output_dir}")
 
 
@@ -90,7 +90,7 @@ class KolamGallery {
                     const placeholder = card.find('.pattern-placeholder');
                     
                     placeholder.html(`
-                        <img src="${data.image}" alt="${data.name}" class="img-fluid">
+                        <img src="${data.image_url}" alt="${data.name}" class="img-fluid">
                     `);
                 }
             } catch (error) {
@@ -127,7 +127,7 @@ class KolamGallery {
 
                 // Update pattern display
                 modalDisplay.html(`
-                    <img src="${data.image}" alt="${data.name}" class="img-fluid">
+                    <img src="${data.image_url}" alt="${data.name}" class="img-fluid">
                 `);
 
                 // Update pattern information
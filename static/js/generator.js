@@ -90,7 +90,7 @@ class KolamGenerator {
             const data = await response.json();
 
             if (data.success) {
-                this.displayPattern(data.image, data.name);
+                this.displayPattern(data.image_url, data.name);
                 this.displayPatternInfo(data.analysis);
                 this.currentPatternId = data.pattern_id;
                 this.enableControls();
@@ -139,11 +139,11 @@ class KolamGenerator {
         return params;
     }
 
-    displayPattern(imageData, patternName) {
+    displayPattern(imageUrl, patternName) {
         const patternDisplay = $('#pattern-display');
         
         patternDisplay.html(`
-            <img src="${imageData}" alt="${patternName}" class="img-fluid">
+            <img src="${imageUrl}" alt="${patternName}" class="img-fluid">
         `).addClass('has-pattern');
 
         // Add fade in animation